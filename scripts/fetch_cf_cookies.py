@@ -5,14 +5,29 @@ from __future__ import annotations
 import argparse
 import json
 import sys
+import time
 from pathlib import Path
 from typing import Sequence
 
-from playwright.sync_api import Error, sync_playwright
+from playwright.sync_api import BrowserContext, Error, Route, sync_playwright
+
+from pfr_scraper.fileio import write_atomic
+from pfr_scraper.http.playwright_fetcher import (
+    BLOCKED_RESOURCE_TYPES,
+    DEFAULT_USER_AGENT,
+    HARVEST_LAUNCH_ARGS,
+    STEALTH_INIT_SCRIPT,
+)
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - fall back to the stdlib encoder
+    orjson = None  # type: ignore[assignment]
 
 DEFAULT_URL = "https://www.pro-football-reference.com/players/A/"
 DEFAULT_OUTPUT = Path("configs/cf_cookies.json")
 DEFAULT_PROFILE_DIR = Path.home() / ".cache" / "pfr-playwright"
+PFR_COOKIE_DOMAINS = ("pro-football-reference.com",)
 
 
 def parse_args(argv: Sequence[str]) -> argparse.Namespace:
@@ -26,13 +41,13 @@ def parse_args(argv: Sequence[str]) -> argparse.Namespace:
         "--output",
         type=Path,
         default=DEFAULT_OUTPUT,
-        help="Path to write harvested cookies (JSON list).",
+        help="Path to write harvested cookies (JSON with the user agent and cookie list).",
     )
     parser.add_argument(
         "--timeout",
         type=float,
         default=45.0,
-        help="Seconds to wait for the page to finish loading after navigation.",
+        help="Seconds to wait for the Cloudflare clearance cookie after navigation.",
     )
     parser.add_argument(
         "--headed",
@@ -61,10 +76,9 @@ def harvest(url: str, output: Path, timeout: float, headed: bool, profile_dir: P
     profile_dir = profile_dir.expanduser()
     profile_dir.mkdir(parents=True, exist_ok=True)
 
-    user_agent = (
-        "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 "
-        "(KHTML, like Gecko) Chrome/139.0.0.0 Safari/537.36"
-    )
+    # cf_clearance is bound to this UA; it is saved alongside the cookies so the
+    # requests-based scrapers can present the same one.
+    user_agent = DEFAULT_USER_AGENT
 
     with sync_playwright() as playwright:
         context = playwright.chromium.launch_persistent_context(
@@ -75,12 +89,7 @@ def harvest(url: str, output: Path, timeout: float, headed: bool, profile_dir: P
             bypass_csp=True,
             accept_downloads=False,
             channel="chrome",
-            args=[
-                "--disable-blink-features=AutomationControlled",
-                "--no-sandbox",
-                "--disable-dev-shm-usage",
-                "--disable-features=IsolateOrigins,site-per-process",
-            ],
+            args=list(HARVEST_LAUNCH_ARGS),
             extra_http_headers={
                 "Accept": (
                     "text/html,application/xhtml+xml,application/xml;q=0.9," "image/avif,image/webp,image/apng,*/*;q=0.8"
@@ -89,27 +98,25 @@ def harvest(url: str, output: Path, timeout: float, headed: bool, profile_dir: P
             },
         )
 
-        context.add_init_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined});")
-        context.add_init_script(
-            """
-            Object.defineProperty(navigator, 'maxTouchPoints', {get: () => 0});
-            Object.defineProperty(navigator, 'platform', {get: () => 'MacIntel'});
-            Object.defineProperty(navigator, 'language', {get: () => 'en-US'});
-            Object.defineProperty(navigator, 'languages', {get: () => ['en-US', 'en']});
-            """
-        )
+        context.add_init_script(STEALTH_INIT_SCRIPT)
+
+        # Scripts are never blocked: the challenge needs them to issue cf_clearance.
+        def _route(route: Route) -> None:
+            if route.request.resource_type in BLOCKED_RESOURCE_TYPES:
+                route.abort()
+            else:
+                route.continue_()
+
+        context.route("**/*", _route)
 
         page = context.pages[0] if context.pages else context.new_page()
 
         try:
             page.goto(url, wait_until="domcontentloaded", timeout=timeout * 1000)
-            page.wait_for_load_state("networkidle", timeout=timeout * 1000)
         except Error:
             # Cloudflare may still complete after DOMContentLoaded; ignore timeout.
             pass
 
-        page.wait_for_timeout(3_000)
-
         if headed:
             print("Press Enter once the page finishes loading...")
             try:
@@ -117,18 +124,21 @@ def harvest(url: str, output: Path, timeout: float, headed: bool, profile_dir: P
             except EOFError:
                 pass
 
-        cookies: list[dict[str, object]] = []
-        has_clearance = False
-        for _ in range(15):  # poll for up to ~15 seconds
-            cookies = [
-                cookie
-                for cookie in context.cookies(url)
-                if cookie["domain"].endswith("pro-football-reference.com")
-            ]
-            has_clearance = any(cookie["name"] == "cf_clearance" for cookie in cookies)
-            if has_clearance:
+        # Re-check cookies whenever a response lands. Quiet periods fall back to a
+        # re-check on an exponential backoff (100ms up to 1.5s) so cookies set
+        # without a fresh response are still noticed promptly.
+        deadline = time.monotonic() + timeout
+        delay_ms = 100
+        cookies, has_clearance = _snapshot_cookies(context, url)
+        while not has_clearance:
+            remaining_ms = (deadline - time.monotonic()) * 1000
+            if remaining_ms <= 0:
                 break
-            page.wait_for_timeout(1_000)
+            try:
+                context.wait_for_event("response", timeout=min(delay_ms, remaining_ms))
+            except Error:
+                delay_ms = min(int(delay_ms * 1.5), 1_500)
+            cookies, has_clearance = _snapshot_cookies(context, url)
 
         if not cookies or not has_clearance:
             context.close()
@@ -142,18 +152,44 @@ def harvest(url: str, output: Path, timeout: float, headed: bool, profile_dir: P
             return 1
 
         if extend and output.exists():
-            existing = json.loads(output.read_text(encoding="utf-8"))
+            existing = _loads(output.read_bytes())
+            if isinstance(existing, dict):
+                existing = existing.get("cookies", [])
             existing_map = {item["name"]: item for item in existing if isinstance(item, dict)}
             existing_map.update({cookie["name"]: cookie for cookie in cookies})
             cookies = list(existing_map.values())  # type: ignore[assignment]
 
-        output.write_text(json.dumps(cookies, indent=2), encoding="utf-8")
+        # A run killed mid-write leaves the previous cookie file intact rather than a
+        # truncated one that breaks ``load_cookies_from_file``.
+        write_atomic(output, _dumps({"user_agent": user_agent, "cookies": cookies}))
         context.close()
 
     print(f"Captured {len(cookies)} cookies -> {output}")
     return 0
 
 
+def _snapshot_cookies(context: BrowserContext, url: str) -> tuple[list[dict[str, object]], bool]:
+    # Single pass: filter by domain and look for the clearance cookie together.
+    cookies: list[dict[str, object]] = []
+    has_clearance = False
+    for cookie in context.cookies(url):
+        if cookie["domain"].endswith(PFR_COOKIE_DOMAINS):
+            cookies.append(cookie)  # type: ignore[arg-type]
+            if cookie["name"] == "cf_clearance":
+                has_clearance = True
+    return cookies, has_clearance
+
+
+def _loads(data: bytes) -> object:
+    return orjson.loads(data) if orjson is not None else json.loads(data)
+
+
+def _dumps(data: object) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    return json.dumps(data, indent=2).encode("utf-8")
+
+
 def main(argv: Sequence[str] | None = None) -> int:
     args = parse_args(argv or sys.argv[1:])
     return harvest(args.url, args.output, args.timeout, args.headed, args.profile_dir, args.extend)
@@ -6,11 +6,9 @@ import argparse
 import sys
 from typing import Sequence
 
-from pfr_scraper.http.cookies import load_cookies_from_file
-from pfr_scraper.scrapers import ActivePlayersScraper
 
-
-ALL_LETTERS = tuple(chr(i) for i in range(ord("A"), ord("Z") + 1))
+ALL_LETTERS = "ABCDEFGHIJKLMNOPQRSTUVWXYZ"
+_VALID_LETTERS = frozenset(ALL_LETTERS)
 
 
 def parse_args(argv: Sequence[str]) -> argparse.Namespace:
@@ -24,8 +22,14 @@ def parse_args(argv: Sequence[str]) -> argparse.Namespace:
     parser.add_argument(
         "--delay",
         type=float,
-        default=3.0,
-        help="Seconds to wait between requests (default: 3s).",
+        default=0.0,
+        help="Fixed seconds between request starts; 0 paces adaptively from ~20 requests/min (default: 0).",
+    )
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=None,
+        help="Number of pages to fetch in parallel (default: settings.fetch_concurrency).",
     )
     return parser.parse_args(argv)
 
@@ -33,15 +37,26 @@ def parse_args(argv: Sequence[str]) -> argparse.Namespace:
 def main(argv: Sequence[str] | None = None) -> int:
     args = parse_args(argv or sys.argv[1:])
 
-    if load_cookies_from_file():
-        print("Loaded Cloudflare cookies from configs/cf_cookies.json")
-
     letters = tuple(letter.upper() for letter in (args.letters if args.letters else ALL_LETTERS))
-    invalid = [letter for letter in letters if len(letter) != 1 or not letter.isalpha()]
+    invalid = [letter for letter in letters if letter not in _VALID_LETTERS]
     if invalid:
         raise SystemExit(f"Invalid letters supplied: {', '.join(invalid)}")
 
-    scraper = ActivePlayersScraper(letters=letters, delay_seconds=args.delay)
+    # Deferred so --help and invalid input exit before importing requests/lxml.
+    from pfr_scraper.http.cookies import load_cookies_from_file
+    from pfr_scraper.scrapers import ActivePlayersScraper
+    from pfr_scraper.settings import settings
+
+    if args.concurrency:
+        settings.fetch_concurrency = args.concurrency
+
+    if load_cookies_from_file():
+        print("Loaded Cloudflare cookies from configs/cf_cookies.json")
+
+    scraper = ActivePlayersScraper(
+        letters=letters,
+        delay_seconds=args.delay,
+    )
     records = scraper.run()
 
     print(f"Scraped {len(records)} active players across indices {', '.join(letters)}.")
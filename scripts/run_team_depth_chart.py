@@ -8,6 +8,7 @@ from typing import Sequence
 
 from pfr_scraper.http.cookies import load_cookies_from_file
 from pfr_scraper.scrapers import DEFAULT_TEAM_CODES, TeamDepthChartScraper
+from pfr_scraper.settings import settings
 
 
 def parse_args(argv: Sequence[str]) -> argparse.Namespace:
@@ -19,17 +20,37 @@ def parse_args(argv: Sequence[str]) -> argparse.Namespace:
         nargs="*",
         help="Optional subset of team codes to scrape (defaults to all active franchises)",
     )
+    parser.add_argument(
+        "--delay",
+        type=float,
+        default=0.0,
+        help="Fixed seconds between request starts; 0 paces adaptively from ~20 requests/min (default: 0).",
+    )
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=None,
+        help="Number of pages to fetch in parallel (default: settings.fetch_concurrency).",
+    )
     return parser.parse_args(argv)
 
 
 def main(argv: Sequence[str] | None = None) -> int:
     args = parse_args(argv or sys.argv[1:])
 
+    if args.concurrency:
+        # Also sizes the session's connection pool to match the worker count.
+        settings.fetch_concurrency = args.concurrency
+
     if load_cookies_from_file():
         print("Loaded Cloudflare cookies from configs/cf_cookies.json")
 
     teams = tuple(args.teams) if args.teams else DEFAULT_TEAM_CODES
-    scraper = TeamDepthChartScraper(season=args.season, teams=teams)
+    scraper = TeamDepthChartScraper(
+        season=args.season,
+        teams=teams,
+        delay_seconds=args.delay,
+    )
     records = scraper.run()
 
     print(f"Scraped {len(records)} depth chart slots for season {args.season}.")
@@ -8,6 +8,7 @@ from typing import Sequence
 
 from pfr_scraper.http.cookies import load_cookies_from_file
 from pfr_scraper.scrapers import DEFAULT_TEAM_CODES, TeamGameLogScraper
+from pfr_scraper.settings import settings
 
 
 def parse_args(argv: Sequence[str]) -> argparse.Namespace:
@@ -24,12 +25,28 @@ def parse_args(argv: Sequence[str]) -> argparse.Namespace:
         action="store_true",
         help="Skip playoff game logs and only export regular season data",
     )
+    parser.add_argument(
+        "--delay",
+        type=float,
+        default=0.0,
+        help="Fixed seconds between request starts; 0 paces adaptively from ~20 requests/min (default: 0).",
+    )
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=None,
+        help="Number of pages to fetch in parallel (default: settings.fetch_concurrency).",
+    )
     return parser.parse_args(argv)
 
 
 def main(argv: Sequence[str] | None = None) -> int:
     args = parse_args(argv or sys.argv[1:])
 
+    if args.concurrency:
+        # Also sizes the session's connection pool to match the worker count.
+        settings.fetch_concurrency = args.concurrency
+
     if load_cookies_from_file():
         print("Loaded Cloudflare cookies from configs/cf_cookies.json")
 
@@ -38,6 +55,7 @@ def main(argv: Sequence[str] | None = None) -> int:
         season=args.season,
         teams=teams,
         include_playoffs=not args.no_playoffs,
+        delay_seconds=args.delay,
     )
     records = scraper.run()
 
@@ -0,0 +1,29 @@
+"""Small filesystem helpers shared by the scrapers and scripts."""
+
+from __future__ import annotations
+
+import contextlib
+import os
+import tempfile
+from pathlib import Path
+
+
+def write_atomic(path: Path, data: bytes) -> None:
+    """Write ``data`` to ``path`` through a uniquely named sibling temp file.
+
+    Readers see either the previous file or the complete new one, never a partial
+    write, and concurrent writers of the same path each use their own temp file.
+    """
+
+    fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as handle:
+            handle.write(data)
+        os.replace(tmp_name, path)
+    except BaseException:
+        with contextlib.suppress(FileNotFoundError):
+            os.unlink(tmp_name)
+        raise
+
+
+__all__ = ["write_atomic"]
@@ -0,0 +1,118 @@
+"""On-disk HTTP response cache with conditional revalidation."""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Mapping
+
+from pfr_scraper.fileio import write_atomic
+from pfr_scraper.settings import settings
+
+CACHE_MAX_AGE_SECONDS = 86_400
+
+
+@dataclass(slots=True)
+class CacheEntry:
+    """A cached response body plus the validators needed to revalidate it."""
+
+    body: bytes
+    encoding: str | None
+    etag: str | None
+    last_modified: str | None
+    stored_at: float
+
+    def is_fresh(self, max_age: float) -> bool:
+        return time.time() - self.stored_at < max_age
+
+    def text(self) -> str:
+        return self.body.decode(self.encoding or "utf-8", errors="replace")
+
+    def validators(self) -> dict[str, str]:
+        """Conditional request headers that let the server answer ``304``."""
+
+        headers: dict[str, str] = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+
+class HttpCache:
+    """Filesystem cache keyed by URL.
+
+    Each URL maps to ``<sha256>.body`` holding the raw response bytes and
+    ``<sha256>.json`` holding its encoding, ``ETag``/``Last-Modified`` validators
+    and the time it was stored. Entries younger than ``max_age`` are served without
+    touching the network; older ones are revalidated with a conditional GET.
+    """
+
+    def __init__(self, directory: Path, *, max_age: float = CACHE_MAX_AGE_SECONDS) -> None:
+        self.directory = directory
+        self.max_age = max_age
+
+    def lookup(self, url: str) -> CacheEntry | None:
+        body_path, meta_path = self._paths(url)
+        try:
+            meta = json.loads(meta_path.read_bytes())
+            body = body_path.read_bytes()
+        except (FileNotFoundError, ValueError):
+            return None
+        return CacheEntry(
+            body=body,
+            encoding=meta.get("encoding"),
+            etag=meta.get("etag"),
+            last_modified=meta.get("last_modified"),
+            stored_at=float(meta.get("stored_at", 0.0)),
+        )
+
+    def store(self, url: str, body: bytes, *, encoding: str | None, headers: Mapping[str, str]) -> None:
+        body_path, _ = self._paths(url)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        write_atomic(body_path, body)
+        self._write_meta(
+            url,
+            CacheEntry(
+                body=body,
+                encoding=encoding,
+                etag=headers.get("ETag"),
+                last_modified=headers.get("Last-Modified"),
+                stored_at=time.time(),
+            ),
+        )
+
+    def refresh(self, url: str, entry: CacheEntry) -> None:
+        """Restart the freshness window of ``entry`` after a ``304``."""
+
+        entry.stored_at = time.time()
+        self._write_meta(url, entry)
+
+    def _write_meta(self, url: str, entry: CacheEntry) -> None:
+        _, meta_path = self._paths(url)
+        meta = {
+            "url": url,
+            "encoding": entry.encoding,
+            "etag": entry.etag,
+            "last_modified": entry.last_modified,
+            "stored_at": entry.stored_at,
+        }
+        write_atomic(meta_path, json.dumps(meta).encode("utf-8"))
+
+    def _paths(self, url: str) -> tuple[Path, Path]:
+        key = hashlib.sha256(url.encode("utf-8")).hexdigest()
+        return self.directory / f"{key}.body", self.directory / f"{key}.json"
+
+
+def http_cache() -> HttpCache | None:
+    """Return the cache under ``data/raw/cache`` when ``PFR_HTTP_CACHE`` is enabled."""
+
+    if not settings.http.cache_enabled:
+        return None
+    return HttpCache(settings.data_paths.raw / "cache")
+
+
+__all__ = ["CACHE_MAX_AGE_SECONDS", "CacheEntry", "HttpCache", "http_cache"]
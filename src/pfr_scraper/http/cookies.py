@@ -3,11 +3,17 @@
 from __future__ import annotations
 
 import json
+from functools import lru_cache
 from pathlib import Path
 from typing import Iterable, Mapping
 
 from pfr_scraper.settings import settings
 
+try:  # pragma: no cover - optional speedup
+    import orjson
+except ImportError:  # pragma: no cover - fall back to the stdlib parser
+    orjson = None  # type: ignore[assignment]
+
 DEFAULT_COOKIE_PATH = Path("configs/cf_cookies.json")
 
 
@@ -15,30 +21,44 @@ def load_cookies_from_file(path: Path = DEFAULT_COOKIE_PATH) -> bool:
     """Load cookies from ``path`` into :mod:`settings.http`.
 
     Returns ``True`` if at least one cookie was applied, ``False`` otherwise.
+    The parsed file is memoized on its modification time and size, so repeated
+    calls against an unchanged file skip the JSON parse. When the file records
+    the ``user_agent`` that harvested the cookies it is stored on
+    ``settings.http.clearance_user_agent`` so sessions can present the same UA.
     """
 
-    if not path.exists():
+    try:
+        stat = path.stat()
+    except FileNotFoundError:
         return False
 
-    payload = json.loads(path.read_text(encoding="utf-8"))
+    cookies, user_agent = _parse_cookie_file(path, stat.st_mtime_ns, stat.st_size)
+    settings.http.cookies.update(cookies)
+    if cookies and user_agent:
+        settings.http.clearance_user_agent = user_agent
+    return bool(cookies)
+
+
+@lru_cache(maxsize=1)
+def _parse_cookie_file(path: Path, mtime_ns: int, size: int) -> tuple[Mapping[str, str], str | None]:
+    # ``mtime_ns`` and ``size`` only participate in the cache key.
+    raw = path.read_bytes()
+    payload = orjson.loads(raw) if orjson is not None else json.loads(raw)
 
     def _iter_cookies(data: object) -> Iterable[Mapping[str, str]]:
         if isinstance(data, list):
             for item in data:
-                if isinstance(item, dict) and {"name", "value"} <= item.keys():
+                if isinstance(item, dict) and "name" in item and "value" in item:
                     yield item  # type: ignore[return-value]
         elif isinstance(data, dict):
-            # allow ``{"cookies": [...]}``
+            # allow ``{"user_agent": "...", "cookies": [...]}``
             inner = data.get("cookies")
             if isinstance(inner, list):
                 yield from _iter_cookies(inner)
 
-    applied = False
-    for cookie in _iter_cookies(payload):
-        settings.http.cookies[cookie["name"]] = cookie["value"]
-        applied = True
-
-    return applied
+    cookies = {cookie["name"]: cookie["value"] for cookie in _iter_cookies(payload)}
+    user_agent = payload.get("user_agent") if isinstance(payload, dict) else None
+    return cookies, user_agent if isinstance(user_agent, str) else None
 
 
 __all__ = ["load_cookies_from_file", "DEFAULT_COOKIE_PATH"]
@@ -2,33 +2,272 @@
 
 from __future__ import annotations
 
-from typing import Optional
+import logging
+import random
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from email.message import Message
+from email.utils import parsedate_to_datetime
+from typing import Callable, Collection, Iterator, Mapping, Optional, TypeVar
 
-import requests
 from requests import Session
-from requests.exceptions import HTTPError
 
 from pfr_scraper.http import build_session
+from pfr_scraper.http.cache import http_cache
 from pfr_scraper.http.playwright_fetcher import fetch_via_playwright
+from pfr_scraper.http.rate_limit import TokenBucket
 
+logger = logging.getLogger(__name__)
 
-def fetch_html(url: str, *, session: Optional[Session] = None, timeout: Optional[float] = None) -> str:
-    """Retrieve HTML for ``url`` using requests, falling back to Playwright on 403."""
+
+class HtmlBytes(bytes):
+    """Undecoded response body tagged with the charset the server declared.
+
+    lxml only sees the bytes, so without the ``Content-Type`` charset a page
+    lacking ``<meta charset>`` would be decoded as Latin-1. ``encoding`` is
+    ``None`` when the server did not declare one.
+    """
+
+    encoding: str | None
+
+    def __new__(cls, body: bytes, encoding: str | None = None) -> "HtmlBytes":
+        page = super().__new__(cls, body)
+        page.encoding = encoding
+        return page
+
+    def __reduce__(self) -> tuple[type["HtmlBytes"], tuple[bytes, str | None]]:
+        # Keep the charset when pages are sent to parse worker processes.
+        return HtmlBytes, (bytes(self), self.encoding)
+
+K = TypeVar("K")
+V = TypeVar("V", str, bytes)
+
+MAX_ATTEMPTS = 6
+RETRY_STATUS_CODES = frozenset({429, 500, 502, 503, 504})
+BACKOFF_BASE_SECONDS = 1.0
+BACKOFF_MAX_SECONDS = 60.0
+# Longest Retry-After a worker will wait out; longer requests fail the fetch instead.
+RETRY_AFTER_MAX_SECONDS = BACKOFF_MAX_SECONDS
+
+
+def fetch_html(
+    url: str,
+    *,
+    session: Optional[Session] = None,
+    timeout: Optional[float] = None,
+    limiter: Optional[TokenBucket] = None,
+) -> str:
+    """Retrieve HTML for ``url`` using requests, falling back to Playwright on 403.
+
+    ``session`` may also be the ``httpx.Client`` returned by :func:`build_session`
+    when HTTP/2 is enabled; only ``get``, ``status_code``, ``raise_for_status`` and
+    ``text`` are relied upon.
+
+    When ``limiter`` is given a token is taken before every attempt and the outcome
+    is reported back to it. Throttling and transient server errors
+    (``RETRY_STATUS_CODES``) are retried up to ``MAX_ATTEMPTS`` times with jittered
+    exponential backoff, honouring ``Retry-After``; the last response is raised if
+    every attempt fails.
+
+    With ``PFR_HTTP_CACHE=1`` responses are kept under ``data/raw/cache``: fresh
+    entries skip the network and stale ones are revalidated with
+    ``If-None-Match``/``If-Modified-Since``, reusing the stored body on ``304``.
+    """
+
+    return _fetch(url, session=session, timeout=timeout, limiter=limiter, binary=False)
+
+
+def fetch_content(
+    url: str,
+    *,
+    session: Optional[Session] = None,
+    timeout: Optional[float] = None,
+    limiter: Optional[TokenBucket] = None,
+) -> bytes:
+    """Like :func:`fetch_html` but return the undecoded response body.
+
+    Parsers that accept bytes (lxml) decode the page themselves, so this skips
+    building an intermediate ``str`` copy of it. The result is :class:`HtmlBytes`
+    carrying the charset from ``Content-Type`` for the parser to use. Playwright
+    fallbacks are re-encoded as UTF-8.
+    """
+
+    return _fetch(url, session=session, timeout=timeout, limiter=limiter, binary=True)
+
+
+def _fetch(
+    url: str,
+    *,
+    session: Optional[Session],
+    timeout: Optional[float],
+    limiter: Optional[TokenBucket],
+    binary: bool,
+) -> str | bytes:
+    cache = http_cache()
+    entry = cache.lookup(url) if cache is not None else None
+    if entry is not None and entry.is_fresh(cache.max_age):
+        return HtmlBytes(entry.body, entry.encoding) if binary else entry.text()
 
     owns_session = session is None
     sess = session or build_session()
     try:
-        response = sess.get(url, timeout=timeout)
-        try:
-            response.raise_for_status()
-        except HTTPError as exc:
-            if response.status_code == 403:
-                return fetch_via_playwright(url)
-            raise exc
-        return response.text
+        # Omit ``timeout`` when unset so the session/client default applies.
+        kwargs: dict[str, object] = {} if timeout is None else {"timeout": timeout}
+        if entry is not None:
+            kwargs["headers"] = entry.validators()
+        for attempt in range(1, MAX_ATTEMPTS + 1):
+            if limiter is not None:
+                limiter.acquire()
+            response = sess.get(url, **kwargs)
+            status = getattr(response, "status_code", None)
+            if status not in RETRY_STATUS_CODES:
+                break
+            retry_after = _retry_after(response)
+            if limiter is not None:
+                limiter.on_failure(None if retry_after is None else min(retry_after, RETRY_AFTER_MAX_SECONDS))
+            if retry_after is not None and retry_after > RETRY_AFTER_MAX_SECONDS:
+                # Hours-long waits would park the worker; raise the throttled status instead.
+                break
+            if attempt < MAX_ATTEMPTS:
+                time.sleep(_backoff(attempt, retry_after))
+
+        if status == 304 and entry is not None:
+            if limiter is not None:
+                limiter.on_success()
+            cache.refresh(url, entry)
+            return HtmlBytes(entry.body, entry.encoding) if binary else entry.text()
+        if status == 403:
+            html = fetch_via_playwright(url)
+            return HtmlBytes(html.encode("utf-8"), "utf-8") if binary else html
+        response.raise_for_status()
+        if limiter is not None:
+            limiter.on_success()
+        charset = _declared_charset(response)
+        if cache is not None:
+            cache.store(url, response.content, encoding=charset, headers=response.headers)
+        return HtmlBytes(response.content, charset) if binary else response.text
     finally:
         if owns_session:
             sess.close()
 
 
-__all__ = ["fetch_html"]
+def _declared_charset(response: object) -> str | None:
+    """Return the ``charset`` parameter of ``Content-Type``, if the server sent one."""
+
+    headers = getattr(response, "headers", None) or {}
+    content_type = headers.get("Content-Type")
+    if not content_type:
+        return None
+    message = Message()
+    message["Content-Type"] = content_type
+    return message.get_content_charset()
+
+
+def _retry_after(response: object) -> float | None:
+    """Parse a ``Retry-After`` header given as seconds or an HTTP date."""
+
+    headers = getattr(response, "headers", None) or {}
+    value = headers.get("Retry-After")
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+def _backoff(attempt: int, retry_after: float | None) -> float:
+    # Full jitter keeps concurrent workers from retrying in lockstep.
+    ceiling = min(BACKOFF_MAX_SECONDS, BACKOFF_BASE_SECONDS * 2 ** (attempt - 1))
+    return max(random.uniform(0, ceiling), min(retry_after or 0.0, RETRY_AFTER_MAX_SECONDS))
+
+
+def fetch_many(
+    urls: Mapping[K, str],
+    *,
+    session: Session,
+    concurrency: int = 1,
+    limiter: Optional[TokenBucket] = None,
+    timeout: Optional[float] = None,
+    fetch: Callable[..., V] = fetch_html,
+    skip_statuses: Collection[int] = (),
+) -> dict[K, V]:
+    """Fetch every URL in ``urls`` and return the HTML keyed like the input.
+
+    Up to ``concurrency`` requests run at once on worker threads sharing ``session``.
+    When ``limiter`` is supplied each request (and each retry) first takes a
+    token from it, so the overall request rate stays bounded regardless of the
+    worker count. Pass ``fetch=fetch_content`` to collect raw bytes instead of
+    decoded text.
+
+    URLs whose request fails with a status in ``skip_statuses`` (e.g. ``404`` for a
+    team without a page that season) are logged and left out of the result rather
+    than aborting the whole batch.
+    """
+
+    pages = dict(
+        iter_fetch_many(
+            urls,
+            session=session,
+            concurrency=concurrency,
+            limiter=limiter,
+            timeout=timeout,
+            fetch=fetch,
+            skip_statuses=skip_statuses,
+        )
+    )
+    return {key: pages[key] for key in urls if key in pages}
+
+
+def iter_fetch_many(
+    urls: Mapping[K, str],
+    *,
+    session: Session,
+    concurrency: int = 1,
+    limiter: Optional[TokenBucket] = None,
+    timeout: Optional[float] = None,
+    fetch: Callable[..., V] = fetch_html,
+    skip_statuses: Collection[int] = (),
+) -> Iterator[tuple[K, V]]:
+    """Like :func:`fetch_many` but yield ``(key, page)`` pairs as requests complete.
+
+    Lets callers start processing the first pages while the rest are still in
+    flight. Closing the iterator early cancels requests that have not started.
+    """
+
+    def _fetch_one(url: str) -> V | None:
+        try:
+            return fetch(url, session=session, timeout=timeout, limiter=limiter)
+        except Exception as exc:
+            status = getattr(getattr(exc, "response", None), "status_code", None)
+            if status is None or status not in skip_statuses:
+                raise
+            logger.info("Skipping %s (HTTP %s)", url, status)
+            return None
+
+    workers = min(concurrency, len(urls))
+    if workers <= 1:
+        for key, url in urls.items():
+            page = _fetch_one(url)
+            if page is not None:
+                yield key, page
+        return
+
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="pfr-fetch") as executor:
+        futures = {executor.submit(_fetch_one, url): key for key, url in urls.items()}
+        try:
+            for future in as_completed(futures):
+                page = future.result()
+                if page is not None:
+                    yield futures[future], page
+        finally:
+            # Runs on errors and when the consumer stops early.
+            for future in futures:
+                future.cancel()
+
+
+__all__ = ["HtmlBytes", "fetch_content", "fetch_html", "fetch_many", "iter_fetch_many"]
@@ -2,8 +2,13 @@
 
 from __future__ import annotations
 
+import atexit
+import functools
+import queue
+import threading
+from concurrent.futures import Future
 from pathlib import Path
-from typing import Optional
+from typing import Any, Callable, Optional, TypeVar
 
 from pfr_scraper.settings import settings
 
@@ -13,6 +18,63 @@ DEFAULT_USER_AGENT = (
     "(KHTML, like Gecko) Chrome/139.0.0.0 Safari/537.36"
 )
 
+# Chromium flags that skip background fetches and helper processes we never use.
+# Chromium honours only the last --disable-features flag, so each tuple carries one.
+_BASE_LAUNCH_ARGS: tuple[str, ...] = (
+    "--disable-blink-features=AutomationControlled",
+    "--no-sandbox",
+    "--disable-dev-shm-usage",
+    "--disable-background-networking",
+    "--disable-default-apps",
+    "--disable-sync",
+    "--disable-translate",
+    "--disable-component-update",
+    "--no-first-run",
+    "--no-default-browser-check",
+    "--mute-audio",
+)
+_DISABLED_FEATURES: tuple[str, ...] = ("Translate", "BackForwardCache", "MediaRouter")
+
+# Long-lived fetcher context: keeps Chromium's default site isolation and renderers.
+LAUNCH_ARGS: tuple[str, ...] = (
+    *_BASE_LAUNCH_ARGS,
+    f"--disable-features={','.join(_DISABLED_FEATURES)}",
+)
+
+# Short-lived cookie harvest: one renderer and no per-site process isolation.
+HARVEST_LAUNCH_ARGS: tuple[str, ...] = (
+    *_BASE_LAUNCH_ARGS,
+    "--renderer-process-limit=1",
+    f"--disable-features={','.join(('IsolateOrigins', 'site-per-process', *_DISABLED_FEATURES))}",
+)
+
+# Navigator patches applied to every page, sent to the browser as a single script.
+STEALTH_INIT_SCRIPT = (
+    "Object.defineProperties(navigator, {"
+    "webdriver: {get: () => undefined},"
+    "maxTouchPoints: {get: () => 0},"
+    "platform: {get: () => 'MacIntel'},"
+    "language: {get: () => 'en-US'},"
+    "languages: {get: () => ['en-US', 'en']}"
+    "});"
+)
+
+# Resource types we never need: only the DOM (or cookies) are consumed.
+BLOCKED_RESOURCE_TYPES = frozenset({"image", "media", "font", "stylesheet"})
+
+# Elements that mark a rendered PFR page: player/team header, stats tables, or the content wrapper.
+CONTENT_SELECTOR = "#meta, table.stats_table, #content"
+CONTENT_WAIT_MS = 5_000
+
+T = TypeVar("T")
+
+_LOCK = threading.Lock()
+_JOBS: "queue.Queue[tuple[Callable[[], Any], Future[Any]]]" = queue.Queue()
+_WORKER: threading.Thread | None = None
+_PLAYWRIGHT: Any = None
+_CONTEXT: Any = None
+_CONTEXT_KEY: tuple[Path, bool] | None = None
+
 
 def fetch_via_playwright(
     url: str,
@@ -21,7 +83,77 @@ def fetch_via_playwright(
     profile_dir: Optional[Path] = None,
     headed: bool = False,
 ) -> str:
-    """Fetch ``url`` using Playwright and return the rendered HTML."""
+    """Fetch ``url`` using Playwright and return the rendered HTML.
+
+    The browser context is launched on first use and shared by subsequent calls,
+    so each fetch only pays for opening a new page rather than a Chromium cold start.
+    Playwright's sync API is bound to the thread that started it, so all browser
+    work runs on one dedicated thread and concurrent callers queue behind it.
+    """
+
+    profile_path = (profile_dir or settings.http.playwright_profile_dir or DEFAULT_PROFILE_DIR).expanduser()
+    return _run_on_browser_thread(_fetch_page, url, timeout=timeout, profile_path=profile_path, headed=headed)
+
+
+def close_playwright() -> None:
+    """Shut down the shared browser context, if one was started."""
+
+    if _WORKER is None or not _WORKER.is_alive():
+        return
+    _run_on_browser_thread(_close_context)
+
+
+def _run_on_browser_thread(func: Callable[..., T], /, *args: Any, **kwargs: Any) -> T:
+    global _WORKER
+
+    with _LOCK:
+        if _WORKER is None or not _WORKER.is_alive():
+            _WORKER = threading.Thread(target=_browser_loop, name="pfr-playwright", daemon=True)
+            _WORKER.start()
+
+    future: Future[T] = Future()
+    _JOBS.put((functools.partial(func, *args, **kwargs), future))
+    return future.result()
+
+
+def _browser_loop() -> None:
+    while True:
+        job, future = _JOBS.get()
+        if not future.set_running_or_notify_cancel():
+            continue
+        try:
+            future.set_result(job())
+        except BaseException as exc:
+            future.set_exception(exc)
+
+
+def _fetch_page(url: str, *, timeout: float, profile_path: Path, headed: bool) -> str:
+    context = _get_context(profile_path, headed=headed)
+
+    from playwright.sync_api import Error
+
+    page = context.new_page()
+    try:
+        page.goto(url, wait_until="domcontentloaded", timeout=timeout * 1000)
+        try:
+            # Return as soon as PFR's content is in the DOM rather than after a fixed sleep.
+            page.wait_for_selector(CONTENT_SELECTOR, state="attached", timeout=CONTENT_WAIT_MS)
+        except Error:
+            pass
+        return page.content()
+    finally:
+        page.close()
+
+
+def _get_context(profile_path: Path, *, headed: bool) -> Any:
+    global _PLAYWRIGHT, _CONTEXT, _CONTEXT_KEY
+
+    key = (profile_path, headed)
+    if _CONTEXT is not None and _CONTEXT_KEY == key:
+        return _CONTEXT
+    if _CONTEXT is not None:
+        # Profile or headed mode changed; relaunch with the new options.
+        _close_context()
 
     try:
         from playwright.sync_api import Error, sync_playwright
@@ -31,7 +163,6 @@ def fetch_via_playwright(
             "`pip install playwright` and run `playwright install chromium`."
         ) from exc
 
-    profile_path = (profile_dir or settings.http.playwright_profile_dir or DEFAULT_PROFILE_DIR).expanduser()
     profile_path.mkdir(parents=True, exist_ok=True)
 
     launch_kwargs = dict(
@@ -41,14 +172,14 @@ def fetch_via_playwright(
         accept_downloads=False,
         bypass_csp=True,
         args=[
-            "--disable-blink-features=AutomationControlled",
-            "--no-sandbox",
-            "--disable-dev-shm-usage",
+            *LAUNCH_ARGS,
+            # Keep a generous disk cache in the persistent profile so static assets survive reruns.
+            "--disk-cache-size=268435456",
         ],
     )
 
-    with sync_playwright() as playwright:
-        context = None
+    playwright = sync_playwright().start()
+    try:
         try:
             context = playwright.chromium.launch_persistent_context(
                 str(profile_path),
@@ -61,30 +192,46 @@ def fetch_via_playwright(
                 str(profile_path),
                 **launch_kwargs,
             )
+    except BaseException:
+        playwright.stop()
+        raise
 
-        context.add_init_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined});")
-        context.add_init_script(
-            """
-            Object.defineProperty(navigator, 'maxTouchPoints', {get: () => 0});
-            Object.defineProperty(navigator, 'platform', {get: () => 'MacIntel'});
-            Object.defineProperty(navigator, 'language', {get: () => 'en-US'});
-            Object.defineProperty(navigator, 'languages', {get: () => ['en-US', 'en']});
-            """
-        )
-
-        page = context.pages[0] if context.pages else context.new_page()
-        try:
-            page.goto(url, wait_until="domcontentloaded", timeout=timeout * 1000)
-            try:
-                page.wait_for_load_state("networkidle", timeout=timeout * 1000)
-            except Error:
-                pass
-            page.wait_for_timeout(3_000)
-            html = page.content()
-        finally:
+    context.add_init_script(STEALTH_INIT_SCRIPT)
+
+    context.route("**/*", _block_heavy_resources)
+
+    _PLAYWRIGHT, _CONTEXT, _CONTEXT_KEY = playwright, context, key
+    return context
+
+
+def _close_context() -> None:
+    global _PLAYWRIGHT, _CONTEXT, _CONTEXT_KEY
+
+    context, playwright = _CONTEXT, _PLAYWRIGHT
+    _PLAYWRIGHT = _CONTEXT = _CONTEXT_KEY = None
+    try:
+        if context is not None:
             context.close()
+    finally:
+        if playwright is not None:
+            playwright.stop()
+
+
+atexit.register(close_playwright)
+
 
-    return html
+def _block_heavy_resources(route: Any) -> None:
+    if route.request.resource_type in BLOCKED_RESOURCE_TYPES:
+        route.abort()
+    else:
+        route.continue_()
 
 
-__all__ = ["fetch_via_playwright"]
+__all__ = [
+    "fetch_via_playwright",
+    "close_playwright",
+    "BLOCKED_RESOURCE_TYPES",
+    "HARVEST_LAUNCH_ARGS",
+    "LAUNCH_ARGS",
+    "STEALTH_INIT_SCRIPT",
+]
@@ -0,0 +1,142 @@
+"""Request rate limiting shared by concurrent fetch workers."""
+
+from __future__ import annotations
+
+import threading
+import time
+from urllib.parse import urlsplit
+
+from pfr_scraper.settings import settings
+
+
+class TokenBucket:
+    """Thread-safe token bucket that caps how often requests may start.
+
+    Parameters
+    ----------
+    rate:
+        Tokens replenished per second, i.e. the sustained requests per second.
+    capacity:
+        Maximum number of tokens that can accumulate. The default of ``1`` means
+        requests are evenly spaced ``1 / rate`` seconds apart with no bursts.
+    """
+
+    def __init__(self, rate: float, *, capacity: float = 1.0) -> None:
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+        self.rate = rate
+        self.capacity = max(1.0, capacity)
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_delay(cls, delay_seconds: float) -> "TokenBucket | None":
+        """Build a bucket spacing requests ``delay_seconds`` apart, or ``None`` for no limit."""
+
+        if delay_seconds <= 0:
+            return None
+        return cls(1.0 / delay_seconds)
+
+    def acquire(self) -> None:
+        """Block until a token is available and consume it."""
+
+        while True:
+            with self._lock:
+                wait = self._take(time.monotonic())
+            if wait <= 0:
+                return
+            time.sleep(wait)
+
+    def on_success(self) -> None:
+        """Feedback hook for a completed request; fixed-rate buckets ignore it."""
+
+    def on_failure(self, retry_after: float | None = None) -> None:
+        """Feedback hook for a throttled (429) request; fixed-rate buckets ignore it."""
+
+    def _take(self, now: float) -> float:
+        # Caller holds the lock. Returns 0 once a token is consumed, else seconds to wait.
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+        if self._tokens >= 1.0:
+            self._tokens -= 1.0
+            return 0.0
+        return (1.0 - self._tokens) / self.rate
+
+
+class AdaptiveTokenBucket(TokenBucket):
+    """Token bucket whose rate follows additive-increase/multiplicative-decrease.
+
+    Every successful request raises the rate by ``increase`` requests per second,
+    up to ``max_rate``. Every throttled request multiplies it by ``decrease``, down
+    to ``min_rate``, empties the bucket and, when the server sent ``Retry-After``,
+    holds all callers until that deadline passes.
+    """
+
+    def __init__(
+        self,
+        rate: float,
+        *,
+        capacity: float = 1.0,
+        min_rate: float = 0.05,
+        max_rate: float | None = None,
+        increase: float = 0.25,
+        decrease: float = 0.5,
+    ) -> None:
+        super().__init__(rate, capacity=capacity)
+        if not 0 < decrease < 1:
+            raise ValueError("decrease must be between 0 and 1")
+        self.min_rate = min(min_rate, rate)
+        self.max_rate = max(max_rate if max_rate is not None else rate * 4, rate)
+        self.increase = increase
+        self.decrease = decrease
+        self._resume_at = 0.0
+
+    def on_success(self) -> None:
+        with self._lock:
+            self.rate = min(self.max_rate, self.rate + self.increase)
+
+    def on_failure(self, retry_after: float | None = None) -> None:
+        with self._lock:
+            now = time.monotonic()
+            self.rate = max(self.min_rate, self.rate * self.decrease)
+            self._tokens = 0.0
+            self._updated = now
+            if retry_after:
+                self._resume_at = max(self._resume_at, now + retry_after)
+
+    def _take(self, now: float) -> float:
+        if now < self._resume_at:
+            return self._resume_at - now
+        return super()._take(now)
+
+
+# Per-success rate increase for host buckets; small enough that a bucket seeded at
+# ``settings.request_rate`` takes a few dozen clean requests to reach its cap.
+HOST_RATE_INCREASE = 0.01
+
+_HOST_BUCKETS: dict[str, AdaptiveTokenBucket] = {}
+_HOST_BUCKETS_LOCK = threading.Lock()
+
+
+def host_bucket(url: str) -> AdaptiveTokenBucket:
+    """Return the process-wide adaptive bucket for ``url``'s host.
+
+    Scrapers hitting the same host share one bucket, so throttling observed by one
+    slows the others too. New buckets start at ``settings.request_rate`` and never
+    exceed ``settings.max_request_rate``.
+    """
+
+    host = urlsplit(url).netloc.lower()
+    with _HOST_BUCKETS_LOCK:
+        bucket = _HOST_BUCKETS.get(host)
+        if bucket is None:
+            bucket = _HOST_BUCKETS[host] = AdaptiveTokenBucket(
+                settings.request_rate,
+                max_rate=settings.max_request_rate,
+                increase=HOST_RATE_INCREASE,
+            )
+        return bucket
+
+
+__all__ = ["HOST_RATE_INCREASE", "AdaptiveTokenBucket", "TokenBucket", "host_bucket"]
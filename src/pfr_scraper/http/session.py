@@ -2,15 +2,26 @@
 
 from __future__ import annotations
 
+import threading
 from typing import Any, Mapping, MutableMapping, Protocol, TYPE_CHECKING
 
 try:
     import requests
+    from requests.adapters import DEFAULT_POOLSIZE, HTTPAdapter
+    from urllib3.util.retry import Retry
 except ImportError:  # pragma: no cover - dependency is optional until runtime
     requests = None  # type: ignore[assignment]
+    HTTPAdapter = object  # type: ignore[assignment,misc]
+    DEFAULT_POOLSIZE = 10
+    Retry = None  # type: ignore[assignment,misc]
 
 from pfr_scraper.settings import settings
 
+try:  # pragma: no cover - optional dependency
+    import httpx
+except ImportError:  # pragma: no cover - HTTP/2 client is opt-in
+    httpx = None  # type: ignore[assignment]
+
 try:  # pragma: no cover - optional dependency during import
     from header_emulator import HeaderEmulator
     from header_emulator.session import RETRYABLE_STATUS_CODES
@@ -29,14 +40,22 @@ class HeaderProvider(Protocol):
         """Return an emulated request payload with headers/cookies."""
 
 
+# Scrapers only talk to a handful of hosts (PFR plus the odd redirect target).
+POOL_CONNECTIONS = 4
+# Transport-level retries for dropped/refused connections. HTTP statuses are left to
+# ``fetch_html`` so throttling still feeds the rate limiter.
+CONNECTION_RETRIES = 3
+CONNECTION_BACKOFF_FACTOR = 0.5
+
 _DEFAULT_EMULATOR: "HeaderEmulator | None" = None
+_DEFAULT_EMULATOR_LOCK = threading.Lock()
 
 
 def build_session(
     emulator: HeaderProvider | None = None,
     *,
     base_headers: Mapping[str, str] | None = None,
-) -> "requests.Session":
+) -> "requests.Session | httpx.Client":
     """Create a `requests.Session` configured with emulator-driven headers.
 
     Parameters
@@ -48,15 +67,38 @@ def build_session(
     base_headers:
         Headers that should always be present on the session. Per-request
         emulator output overrides keys from this mapping when overlaps occur.
+
+    When ``settings.http.http2`` is set (``PFR_HTTP2=1``) an ``httpx.Client`` with
+    HTTP/2 enabled is returned instead. It exposes the same ``get``/``close``
+    surface the scrapers use and multiplexes requests over one connection.
     """
 
+    resolved_emulator = emulator or _get_default_emulator()
+
+    if settings.http.http2:
+        return _build_http2_client(resolved_emulator, base_headers)
+
     if requests is None:
         raise ImportError("requests must be installed to create an HTTP session")
 
-    resolved_emulator = emulator or _get_default_emulator()
-
     session = requests.Session()
-    headers: MutableMapping[str, str] = session.headers.copy()
+    headers = _default_headers(session.headers, base_headers)
+    session.headers.clear()
+    session.headers.update(headers)
+
+    if settings.http.cookies:
+        session.cookies.update(settings.http.cookies)
+
+    _attach_request_pipeline(session, resolved_emulator)
+
+    return session
+
+
+def _default_headers(
+    initial: Mapping[str, str],
+    base_headers: Mapping[str, str] | None,
+) -> MutableMapping[str, str]:
+    headers: MutableMapping[str, str] = dict(initial)
 
     if settings.http.base_headers:
         headers.update(settings.http.base_headers)
@@ -67,15 +109,68 @@ def build_session(
     if base_headers:
         headers.update(base_headers)
 
-    session.headers.clear()
-    session.headers.update(headers)
+    pinned = _clearance_user_agent()
+    if pinned:
+        headers["User-Agent"] = pinned
 
-    if settings.http.cookies:
-        session.cookies.update(settings.http.cookies)
+    return headers
 
-    _attach_request_pipeline(session, resolved_emulator)
 
-    return session
+def _clearance_user_agent() -> str | None:
+    """Return the UA ``cf_clearance`` was issued to, if that cookie is loaded.
+
+    Cloudflare binds clearance to the user agent that solved the challenge; sending
+    the cookie with any other UA earns a 403 and a slow Playwright fallback.
+    """
+
+    if "cf_clearance" in settings.http.cookies:
+        return settings.http.clearance_user_agent
+    return None
+
+
+def _locked_headers() -> frozenset[str]:
+    return frozenset({"user-agent"}) if _clearance_user_agent() else frozenset()
+
+
+def _build_http2_client(emulator: HeaderProvider, base_headers: Mapping[str, str] | None) -> "httpx.Client":
+    if httpx is None:
+        raise ImportError("httpx (with the http2 extra) must be installed to use PFR_HTTP2")
+
+    # Match the requests pool sizing so every fetch worker can hold a warm connection.
+    # No explicit transport: httpx only honours HTTP(S)_PROXY/NO_PROXY for the transports
+    # it builds itself, so connect retries (a transport option) are not applied here.
+    pool_size = max(DEFAULT_POOLSIZE, settings.fetch_concurrency)
+    limits = httpx.Limits(max_keepalive_connections=pool_size, max_connections=pool_size * 2)
+    client = httpx.Client(
+        http2=True,
+        limits=limits,
+        timeout=settings.request_timeout,
+        cookies=settings.http.cookies,
+        follow_redirects=True,
+    )
+    headers = _default_headers(client.headers, base_headers)
+    client.headers.clear()
+    client.headers.update(headers)
+
+    locked = _locked_headers()
+
+    # httpx fixes proxies per client, so emulator proxy rotation is not applied here.
+    def on_request(request: "httpx.Request") -> None:
+        emulated = emulator.next_request()
+        request.extensions["pfr_emulated"] = emulated
+        _apply_emulated(request.headers, emulated, client.headers, locked)
+
+    def on_response(response: "httpx.Response") -> None:
+        emulated = response.request.extensions.get("pfr_emulated")
+        if emulated is None:
+            return
+        if _should_flag_failure(response):
+            _record_failure(emulator, emulated)
+        else:
+            _record_success(emulator, emulated)
+
+    client.event_hooks = {"request": [on_request], "response": [on_response]}
+    return client
 
 
 def _get_default_emulator() -> HeaderProvider:
@@ -86,53 +181,117 @@ def _get_default_emulator() -> HeaderProvider:
 
     global _DEFAULT_EMULATOR
     if _DEFAULT_EMULATOR is None:
-        _DEFAULT_EMULATOR = HeaderEmulator()
+        # Concurrent workers may race here; only one should load the emulator profiles.
+        with _DEFAULT_EMULATOR_LOCK:
+            if _DEFAULT_EMULATOR is None:
+                _DEFAULT_EMULATOR = HeaderEmulator()
     return _DEFAULT_EMULATOR
 
 
-def _attach_request_pipeline(session: "requests.Session", emulator: HeaderProvider) -> None:
-    original_request = session.request
-
-    def request(method: str, url: str, **kwargs: Any) -> Any:
-        emulated = emulator.next_request()
-
-        headers = session.headers.copy()
-        headers.update(emulated.headers)
+class EmulatorAdapter(HTTPAdapter):  # type: ignore[misc,valid-type]
+    """Transport adapter that applies emulator output to every outgoing request.
 
-        extra_headers = kwargs.pop("headers", None)
-        if extra_headers:
-            headers.update(extra_headers)
-        kwargs["headers"] = headers
-
-        cookies = dict(emulated.cookies)
-        extra_cookies = kwargs.pop("cookies", None)
-        if extra_cookies:
-            cookies.update(extra_cookies)
-        if cookies:
-            kwargs["cookies"] = cookies
-
-        if emulated.proxy is not None and kwargs.get("proxies") is None:
-            kwargs["proxies"] = _proxy_mapping(emulated.proxy)
+    Headers are written into the already-prepared request in place. Precedence is
+    session defaults < emulator output < per-call headers: an emulated header only
+    replaces a value that still matches the session default. Emulated cookies fill
+    in names that the session jar and per-call cookies did not already set.
+    """
 
-        kwargs.setdefault("timeout", settings.request_timeout)
+    def __init__(
+        self,
+        emulator: HeaderProvider,
+        session_headers: Mapping[str, str],
+        *,
+        locked_headers: frozenset[str] = frozenset(),
+        **kwargs: Any,
+    ) -> None:
+        self.emulator = emulator
+        self.session_headers = session_headers
+        self.locked_headers = locked_headers
+        super().__init__(**kwargs)
+
+    def send(self, request: "requests.PreparedRequest", **kwargs: Any) -> "requests.Response":
+        emulated = self.emulator.next_request()
+        _apply_emulated(request.headers, emulated, self.session_headers, self.locked_headers)
+
+        if emulated.proxy is not None:
+            # Only pay for a merged copy when the environment contributed proxies.
+            mapping = _proxy_mapping(emulated.proxy)
+            proxies = kwargs.get("proxies")
+            if proxies:
+                mapping = {**proxies, **mapping}
+            kwargs["proxies"] = mapping
+
+        if kwargs.get("timeout") is None:
+            kwargs["timeout"] = settings.request_timeout
 
         try:
-            response = original_request(method, url, **kwargs)
+            response = super().send(request, **kwargs)
         except requests.RequestException:
-            _record_failure(emulator, emulated)
-            _mark_proxy(emulator, emulated.proxy, success=False)
+            _record_failure(self.emulator, emulated)
+            _mark_proxy(self.emulator, emulated.proxy, success=False)
             raise
 
         if _should_flag_failure(response):
-            _record_failure(emulator, emulated)
-            _mark_proxy(emulator, emulated.proxy, success=False)
+            _record_failure(self.emulator, emulated)
+            _mark_proxy(self.emulator, emulated.proxy, success=False)
         else:
-            _record_success(emulator, emulated)
-            _mark_proxy(emulator, emulated.proxy, success=True)
+            _record_success(self.emulator, emulated)
+            _mark_proxy(self.emulator, emulated.proxy, success=True)
 
         return response
 
-    session.request = request  # type: ignore[assignment]
+
+def _attach_request_pipeline(session: "requests.Session", emulator: HeaderProvider) -> None:
+    # Size the pool to the fetch fan-out so parallel workers keep their keep-alive
+    # connections instead of urllib3 discarding the ones beyond its default of 10.
+    pool_size = max(DEFAULT_POOLSIZE, settings.fetch_concurrency)
+    retries = Retry(
+        total=CONNECTION_RETRIES,
+        backoff_factor=CONNECTION_BACKOFF_FACTOR,
+        allowed_methods=frozenset({"GET", "HEAD"}),
+        status_forcelist=(),
+        # urllib3 otherwise retries 413/429/503 carrying Retry-After on its own,
+        # sleeping inside the adapter and hiding the throttling from the limiter.
+        respect_retry_after_header=False,
+        raise_on_status=False,
+    )
+    adapter = EmulatorAdapter(
+        emulator,
+        session.headers,
+        locked_headers=_locked_headers(),
+        pool_connections=POOL_CONNECTIONS,
+        pool_maxsize=pool_size,
+        max_retries=retries,
+    )
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+
+
+def _apply_emulated(
+    headers: MutableMapping[str, str],
+    emulated: "EmulatedRequest",
+    defaults: Mapping[str, str],
+    locked: frozenset[str] = frozenset(),
+) -> None:
+    """Write emulator headers/cookies into ``headers`` without clobbering per-call values.
+
+    ``locked`` holds lower-cased header names the emulator may not rotate.
+    """
+
+    for name, value in emulated.headers.items():
+        if name.lower() in locked:
+            continue
+        current = headers.get(name)
+        if current is None or current == defaults.get(name):
+            headers[name] = value
+
+    if emulated.cookies:
+        existing = headers.get("Cookie")
+        present = {part.split("=", 1)[0].strip() for part in existing.split(";")} if existing else set()
+        extra = "; ".join(f"{name}={value}" for name, value in emulated.cookies.items() if name not in present)
+        if extra:
+            headers["Cookie"] = f"{existing}; {extra}" if existing else extra
 
 
 def _should_flag_failure(response: Any) -> bool:
@@ -2,24 +2,34 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
-from typing import Iterable, List, Mapping, Sequence
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+from operator import attrgetter
+from typing import Iterable, Iterator, List, Mapping, NamedTuple, Sequence
 
-import time
-
-from bs4 import BeautifulSoup
-from bs4.element import Tag
+from lxml import etree
 
 from pfr_scraper.http import build_session
-from pfr_scraper.http.fetch import fetch_html
-from pfr_scraper.scrapers.base import Scraper
+from pfr_scraper.http.fetch import fetch_content, iter_fetch_many
+from pfr_scraper.http.rate_limit import TokenBucket, host_bucket
+from pfr_scraper.scrapers.base import Scraper, extract_player_id, parse_html, write_csv
 from pfr_scraper.settings import settings
 
 BASE_URL = "https://www.pro-football-reference.com"
 
+# Active players are bolded in the index; select their anchors directly. Anchors with a
+# blank href carry no player id, so they are skipped.
+PLAYER_ANCHORS_XPATH = etree.XPath('//div[@id="div_players"]//b/a[1][normalize-space(@href)]')
+
+# Parse workers start while fetch threads hold urllib3/ssl/logging locks, so they must
+# not be forked from this process; a forkserver (or spawn) child starts clean.
+_PARSE_CONTEXT = multiprocessing.get_context(
+    "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else "spawn"
+)
 
-@dataclass(slots=True)
-class ActivePlayerRecord:
+
+class ActivePlayerRecord(NamedTuple):
     """Structured representation of an active player's metadata."""
 
     player_id: str
@@ -31,6 +41,9 @@ class ActivePlayerRecord:
     position: str | None
 
 
+_FIELDNAMES = ActivePlayerRecord._fields
+
+
 class ActivePlayersScraper(Scraper):
     """Scrape every active player index page and persist the results as CSV."""
 
@@ -39,68 +52,85 @@ class ActivePlayersScraper(Scraper):
         *,
         letters: Sequence[str] | None = None,
         delay_seconds: float = 0.0,
+        concurrency: int | None = None,
     ) -> None:
         self.letters: tuple[str, ...] = tuple(
             letter.upper() for letter in (letters or tuple(chr(i) for i in range(ord("A"), ord("Z") + 1)))
         )
         self.delay_seconds = max(0.0, delay_seconds)
+        self.concurrency = max(1, concurrency or settings.fetch_concurrency)
 
     @property
     def endpoint(self) -> str:
         # Base index page; individual letter pages live beneath this path.
         return f"{BASE_URL}/players/"
 
-    def fetch(self) -> Mapping[str, str]:  # type: ignore[override]
+    def fetch(self) -> Mapping[str, bytes]:  # type: ignore[override]
         """Retrieve HTML for each letter-specific player index page."""
 
+        pages = dict(self.iter_fetch())
+        return {letter: pages[letter] for letter in self.letters if letter in pages}
+
+    def iter_fetch(self) -> Iterator[tuple[str, bytes]]:  # type: ignore[override]
+        """Yield ``(letter, html)`` pairs as each index page finishes downloading.
+
+        Letters are fetched concurrently. Requests are paced by the adaptive
+        per-host bucket shared with the other scrapers, or, when ``delay_seconds``
+        is set, by a fixed spacing between request starts.
+        """
+
+        urls = {letter: f"{self.endpoint}{letter}/" for letter in self.letters}
         session = build_session()
-        responses: dict[str, str] = {}
         try:
-            for index, letter in enumerate(self.letters):
-                url = f"{self.endpoint}{letter}/"
-                responses[letter] = fetch_html(url, session=session)
-                if self.delay_seconds > 0 and index < len(self.letters) - 1:
-                    time.sleep(self.delay_seconds)
+            yield from iter_fetch_many(
+                urls,
+                session=session,
+                concurrency=self.concurrency,
+                limiter=TokenBucket.from_delay(self.delay_seconds) or host_bucket(BASE_URL),
+                fetch=fetch_content,
+            )
         finally:
             session.close()
-        return responses
 
-    def parse(self, payload: Mapping[str, str]) -> List[ActivePlayerRecord]:  # type: ignore[override]
+    def parse(self, payload: Mapping[str, bytes]) -> List[ActivePlayerRecord]:  # type: ignore[override]
         """Extract active player metadata from each letter page."""
 
-        records: dict[str, ActivePlayerRecord] = {}
-        for letter, html in payload.items():
-            soup = BeautifulSoup(html, "html.parser")
-            container = soup.find("div", id="div_players")
-            if container is None:
-                continue
+        return self._parse_pages(payload.items(), len(payload))
 
-            for bold in container.find_all("b"):
-                anchor = bold.find("a")
-                if anchor is None or not anchor.get("href"):
-                    continue
+    def parse_stream(self, pages: Iterable[tuple[str, bytes]]) -> List[ActivePlayerRecord]:  # type: ignore[override]
+        """Parse pages as :meth:`iter_fetch` yields them."""
 
-                name = anchor.get_text(strip=True)
-                href = anchor["href"]
-                player_id = _extract_player_id(href)
-                full_url = _resolve_url(href)
+        return self._parse_pages(pages, len(self.letters))
 
-                position = _extract_position(bold, name)
-                first_name, last_name = _split_name(name)
+    def _parse_pages(self, pages: Iterable[tuple[str, bytes]], count: int) -> List[ActivePlayerRecord]:
+        # Parsing is CPU bound, so multiple pages are spread across worker processes.
+        # Each page is submitted as soon as it arrives, overlapping downloads still
+        # in flight.
+        if count > 1:
+            workers = min(count, os.cpu_count() or 1)
+            with ProcessPoolExecutor(max_workers=workers, mp_context=_PARSE_CONTEXT) as executor:
+                futures = [executor.submit(_parse_letter, letter, content) for letter, content in pages]
+                parsed = [future.result() for future in futures]
+        else:
+            parsed = [_parse_letter(letter, content) for letter, content in pages]
 
+        records: dict[str, ActivePlayerRecord] = {}
+        for letter_records in parsed:
+            for record in letter_records:
                 # Deduplicate based on player id in case pages overlap unexpectedly.
-                records[player_id] = ActivePlayerRecord(
-                    player_id=player_id,
-                    player_name=name,
-                    first_name=first_name,
-                    last_name=last_name,
-                    letter=letter,
-                    url=full_url,
-                    position=position,
-                )
-
-        # Sort for deterministic output (alphabetical by letter then name).
-        return sorted(records.values(), key=lambda record: (record.letter, record.player_name))
+                records[record.player_id] = record
+
+        # Sort for deterministic output (alphabetical by letter then name). Grouping by
+        # letter first means only names are compared, via a C-level key getter.
+        per_letter: dict[str, list[ActivePlayerRecord]] = {}
+        for record in records.values():
+            per_letter.setdefault(record.letter, []).append(record)
+
+        ordered: list[ActivePlayerRecord] = []
+        by_name = attrgetter("player_name")
+        for letter in sorted(per_letter):
+            ordered.extend(sorted(per_letter[letter], key=by_name))
+        return ordered
 
     def persist(self, records: Iterable[ActivePlayerRecord]) -> None:  # type: ignore[override]
         """Write the extracted player list to the processed data directory."""
@@ -109,38 +139,37 @@ class ActivePlayersScraper(Scraper):
         processed_dir.mkdir(parents=True, exist_ok=True)
         output_path = processed_dir / "active_players.csv"
 
-        fieldnames = [
-            "player_id",
-            "player_name",
-            "first_name",
-            "last_name",
-            "letter",
-            "url",
-            "position",
-        ]
-
-        import csv
-
-        with output_path.open("w", encoding="utf-8", newline="") as handle:
-            writer = csv.DictWriter(handle, fieldnames=fieldnames)
-            writer.writeheader()
-            for record in records:
-                writer.writerow(
-                    {
-                        "player_id": record.player_id,
-                        "player_name": record.player_name,
-                        "first_name": record.first_name,
-                        "last_name": record.last_name,
-                        "letter": record.letter,
-                        "url": record.url,
-                        "position": record.position or "",
-                    }
-                )
-
-
-def _extract_player_id(href: str) -> str:
-    filename = href.rstrip("/").split("/")[-1]
-    return filename.removesuffix(".htm")
+        write_csv(output_path, _FIELDNAMES, records)
+
+
+def _parse_letter(letter: str, content: bytes) -> list[ActivePlayerRecord]:
+    # Module level so ProcessPoolExecutor can pickle it.
+    if not content:
+        return []
+
+    records: list[ActivePlayerRecord] = []
+    root = parse_html(content)
+    for anchor in PLAYER_ANCHORS_XPATH(root):
+        name = anchor.text_content().strip()
+        href = anchor.get("href")
+        first_name, last_name = _split_name(name)
+        # The position is the "(QB)" text right after </a> inside the bold tag.
+        suffix = (anchor.tail or "").strip()
+        position = None
+        if suffix.startswith("(") and suffix.endswith(")"):
+            position = suffix[1:-1].strip() or None
+        records.append(
+            ActivePlayerRecord(
+                player_id=extract_player_id(href) or "",
+                player_name=name,
+                first_name=first_name,
+                last_name=last_name,
+                letter=letter,
+                url=_resolve_url(href),
+                position=position,
+            )
+        )
+    return records
 
 
 def _resolve_url(href: str) -> str:
@@ -149,16 +178,6 @@ def _resolve_url(href: str) -> str:
     return f"{BASE_URL}{href}"
 
 
-def _extract_position(bold_tag: Tag, player_name: str) -> str | None:
-    """Return the position text that follows the anchor within the bold tag."""
-
-    bold_text = bold_tag.get_text(" ", strip=True)
-    suffix = bold_text[len(player_name) :].strip()
-    if suffix.startswith("(") and suffix.endswith(")"):
-        return suffix[1:-1].strip() or None
-    return None
-
-
 def _split_name(full_name: str) -> tuple[str, str]:
     if not full_name:
         return "", ""
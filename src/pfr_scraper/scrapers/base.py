@@ -2,20 +2,52 @@
 
 from __future__ import annotations
 
+import csv
+import gzip
+import re
+import threading
 from abc import ABC, abstractmethod
-from typing import Any, Iterable
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Callable, Collection, Iterable, Iterator, Mapping, Sequence
+
+from lxml import etree
+from lxml import html as lxml_html
 
 from pfr_scraper.http.fetch import fetch_html
+from pfr_scraper.settings import settings
+
+RAW_WRITE_WORKERS = 8
+RAW_GZIP_LEVEL = 1
+# Output CSVs are written through a 1 MiB buffer so rows are flushed in large blocks.
+CSV_BUFFER_SIZE = 1 << 20
+COLUMNAR_FORMATS = frozenset({"parquet", "feather"})
+COLUMNAR_COMPRESSION = "zstd"
+# Row predicate dropping the header rows PFR repeats inside <tbody>. Class tokens are
+# matched whole, so a class that merely contains "thead" is kept.
+NOT_THEAD_ROW = '[not(contains(concat(" ", normalize-space(@class), " "), " thead "))]'
+
+_PARSERS = threading.local()
+# Last path segment without a trailing slash or .htm/.html suffix.
+_PLAYER_ID_RE = re.compile(r"(?:^|/)([^/]+?)(?:\.html?)?/?$")
 
 
 class Scraper(ABC):
     """Template method for concrete scrapers."""
 
     def run(self) -> Iterable[Any]:
-        """Execute the scraper and yield parsed records."""
+        """Execute the scraper and yield parsed records.
 
-        raw_payload = self.fetch()
-        records = self.parse(raw_payload)
+        Scrapers that implement :meth:`iter_fetch` stream pages into
+        :meth:`parse_stream` as they arrive, so parsing overlaps the remaining
+        network waits instead of starting after the last download.
+        """
+
+        stream = self.iter_fetch()
+        if stream is None:
+            records = self.parse(self.fetch())
+        else:
+            records = self.parse_stream(stream)
         self.persist(records)
         return records
 
@@ -28,6 +60,23 @@ class Scraper(ABC):
 
         return fetch_html(self.endpoint)
 
+    def iter_fetch(self) -> Iterator[tuple[Any, Any]] | None:
+        """Optionally yield ``(key, payload)`` pairs as they are retrieved.
+
+        Returns ``None`` by default, meaning the scraper only supports the batch
+        :meth:`fetch`/:meth:`parse` path.
+        """
+
+        return None
+
+    def parse_stream(self, pages: Iterable[tuple[Any, Any]]) -> Iterable[Any]:
+        """Convert streamed ``(key, payload)`` pairs into records.
+
+        The default collects the stream and defers to :meth:`parse`.
+        """
+
+        return self.parse(dict(pages))
+
     @property
     @abstractmethod
     def endpoint(self) -> str:
@@ -41,3 +90,153 @@ class Scraper(ABC):
         """Hook for saving records. Default implementation is a no-op."""
 
         return None
+
+
+def parse_html(content: bytes) -> etree._Element:
+    """Parse ``content`` with this thread's reusable lxml HTML parser.
+
+    One parser per thread and charset avoids rebuilding parser state for every
+    page, and skips the id index and comment nodes that no scraper reads. The
+    charset declared by the server (see :class:`pfr_scraper.http.fetch.HtmlBytes`) is passed to lxml;
+    otherwise lxml falls back to ``<meta charset>`` or its own detection.
+    """
+
+    encoding = getattr(content, "encoding", None)
+    parsers = getattr(_PARSERS, "by_encoding", None)
+    if parsers is None:
+        parsers = _PARSERS.by_encoding = {}
+    parser = parsers.get(encoding)
+    if parser is None:
+        try:
+            parser = lxml_html.HTMLParser(encoding=encoding, collect_ids=False, remove_comments=True)
+        except LookupError:
+            # Unknown charset label from the server; let lxml detect it instead.
+            parser = lxml_html.HTMLParser(collect_ids=False, remove_comments=True)
+        parsers[encoding] = parser
+    return lxml_html.fromstring(content, parser=parser)
+
+
+def cell_text(cell: etree._Element | None) -> str | None:
+    """Return the stripped text of a table cell, or ``None`` when missing or blank."""
+
+    if cell is None:
+        return None
+    # Most cells hold a bare text node; only walk descendants when there are children.
+    text = (cell.text_content() if len(cell) else cell.text or "").strip()
+    return text or None
+
+
+def extract_player_id(href: str | None) -> str | None:
+    """Return the PFR player id from a player link, e.g. ``MahoPa00`` for ``/players/M/MahoPa00.htm``."""
+
+    if not href:
+        return None
+    match = _PLAYER_ID_RE.search(href)
+    return match.group(1) if match else None
+
+
+def write_raw_pages(raw_dir: Path, pages: Mapping[str, bytes]) -> None:
+    """Write each page to ``raw_dir/<key>.html`` using a small thread pool.
+
+    Snapshot writes are I/O bound, so overlapping them hides most of the per-file
+    latency without contending for the GIL. With ``settings.raw_compression`` set
+    to ``"gzip"`` pages are written as ``<key>.html.gz`` at a fast compression level.
+    """
+
+    if not pages:
+        return
+
+    compression = settings.raw_compression
+    if compression not in (None, "gzip"):
+        raise ValueError(f"Unsupported raw compression: {compression!r}")
+
+    raw_dir.mkdir(parents=True, exist_ok=True)
+
+    def _write(item: tuple[str, bytes]) -> None:
+        key, content = item
+        if compression == "gzip":
+            (raw_dir / f"{key}.html.gz").write_bytes(gzip.compress(content, compresslevel=RAW_GZIP_LEVEL))
+        else:
+            (raw_dir / f"{key}.html").write_bytes(content)
+
+    workers = min(RAW_WRITE_WORKERS, len(pages))
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="pfr-raw") as executor:
+        # Consume the iterator so write errors propagate.
+        list(executor.map(_write, pages.items()))
+
+
+def write_csv(
+    path: Path,
+    fieldnames: Sequence[str],
+    rows: Iterable[Sequence[Any]],
+    *,
+    format_row: Callable[[Sequence[Any]], str] | None = None,
+) -> None:
+    """Write ``fieldnames`` and then ``rows`` to ``path`` as a UTF-8 CSV.
+
+    The header is static, so an empty run still produces a readable CSV. Rows go
+    through ``csv.writer`` (``None`` becomes an empty field) unless ``format_row``,
+    e.g. from :func:`csv_line_formatter`, is given.
+    """
+
+    with path.open("w", encoding="utf-8", newline="", buffering=CSV_BUFFER_SIZE) as handle:
+        if format_row is not None:
+            handle.write(format_row(fieldnames))
+            handle.writelines(map(format_row, rows))
+        else:
+            writer = csv.writer(handle)
+            writer.writerow(fieldnames)
+            writer.writerows(rows)
+
+
+def csv_line_formatter(width: int, *, integer_slots: Collection[int] = ()) -> Callable[[Sequence[Any]], str]:
+    """Generate a function rendering a ``width``-field row as one CSV line.
+
+    The output matches ``csv.writer`` with the default dialect for rows holding
+    strings, ``None`` and, in ``integer_slots``, ints. The row layout is unrolled
+    into a single f-string, skipping the writer's per-cell type dispatch.
+    """
+
+    parts = ",".join(f"{{row[{i}]}}" if i in integer_slots else f"{{_escape(row[{i}])}}" for i in range(width))
+    namespace: dict[str, Any] = {"_escape": _escape_csv_field}
+    exec(f'def format_row(row):\n    return f"{parts}\\r\\n"\n', namespace)
+    return namespace["format_row"]
+
+
+def _escape_csv_field(value: str | None) -> str:
+    if value is None:
+        return ""
+    if '"' in value or "," in value or "\n" in value or "\r" in value:
+        return '"' + value.replace('"', '""') + '"'
+    return value
+
+
+def write_columnar(
+    path: Path,
+    columns: Mapping[str, Sequence[Any]],
+    *,
+    output_format: str,
+    integer_columns: Collection[str] = (),
+) -> None:
+    """Write ``columns`` to ``path`` as a zstd-compressed Parquet or Feather file.
+
+    Columns are typed as nullable strings except ``integer_columns``, so empty or
+    all-blank columns keep a stable schema.
+    """
+
+    if output_format not in COLUMNAR_FORMATS:
+        raise ValueError(f"Unsupported columnar output format: {output_format!r}")
+    # Imported here so CSV runs and parse workers never load pyarrow.
+    try:
+        import pyarrow as pa
+        from pyarrow import feather
+        from pyarrow import parquet as pq
+    except ImportError as exc:  # pragma: no cover - optional dependency
+        raise ImportError(f"pyarrow must be installed to write {output_format} output") from exc
+
+    schema = pa.schema([(name, pa.int64() if name in integer_columns else pa.string()) for name in columns])
+    table = pa.table({name: list(values) for name, values in columns.items()}, schema=schema)
+    if output_format == "parquet":
+        pq.write_table(table, path, compression=COLUMNAR_COMPRESSION)
+    else:
+        feather.write_feather(table, path, compression=COLUMNAR_COMPRESSION)
@@ -2,24 +2,27 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass, asdict
-from typing import Iterable, Mapping, MutableMapping, Sequence
+from typing import Iterable, Mapping, MutableMapping, NamedTuple, Sequence
 
-from bs4 import BeautifulSoup
-from bs4.element import Tag
+from lxml import etree
 
 from pfr_scraper.http import build_session
-from pfr_scraper.http.fetch import fetch_html
-from pfr_scraper.scrapers.base import Scraper
+from pfr_scraper.http.fetch import fetch_content, fetch_many
+from pfr_scraper.http.rate_limit import TokenBucket, host_bucket
+from pfr_scraper.scrapers.base import NOT_THEAD_ROW, Scraper, extract_player_id, parse_html, write_csv, write_raw_pages
 from pfr_scraper.settings import settings
 
 BASE_URL = "https://www.pro-football-reference.com"
 
 DEPTH_CHART_TABLE_PREFIX = "depth_chart"
 
+DEPTH_CHART_TABLES_XPATH = etree.XPath(f'//table[starts-with(@id, "{DEPTH_CHART_TABLE_PREFIX}")]')
+DEPTH_CHART_ROWS_XPATH = etree.XPath(f"./tbody/tr{NOT_THEAD_ROW}")
+# Text nodes of a cell that are not player names, e.g. the "(PS)" after an anchor.
+NOTE_TEXT_XPATH = etree.XPath(".//text()[not(ancestor::a)]")
 
-@dataclass(slots=True)
-class TeamDepthChartRecord:
+
+class TeamDepthChartRecord(NamedTuple):
     """Normalized representation of a depth chart slot."""
 
     season: int
@@ -33,6 +36,9 @@ class TeamDepthChartRecord:
     note: str | None
 
 
+_FIELDNAMES = TeamDepthChartRecord._fields
+
+
 class TeamDepthChartScraper(Scraper):
     """Scrape depth charts for teams in a given season."""
 
@@ -41,52 +47,52 @@ class TeamDepthChartScraper(Scraper):
         *,
         season: int,
         teams: Sequence[str],
+        delay_seconds: float = 0.0,
+        concurrency: int | None = None,
     ) -> None:
         self.season = season
         self.teams: tuple[str, ...] = tuple(teams)
-        self._latest_pages: MutableMapping[str, str] = {}
+        self.delay_seconds = max(0.0, delay_seconds)
+        self.concurrency = max(1, concurrency or settings.fetch_concurrency)
+        self._latest_pages: MutableMapping[str, bytes] = {}
 
     @property
     def endpoint(self) -> str:
         return f"{BASE_URL}/teams/"
 
-    def fetch(self) -> Mapping[str, str]:  # type: ignore[override]
+    def fetch(self) -> Mapping[str, bytes]:  # type: ignore[override]
+        urls = {team: f"{self.endpoint}{team}/{self.season}_depth_chart.htm" for team in self.teams}
         session = build_session()
-        pages: dict[str, str] = {}
         try:
-            for team in self.teams:
-                url = f"{self.endpoint}{team}/{self.season}_depth_chart.htm"
-                pages[team] = fetch_html(url, session=session)
+            pages = fetch_many(
+                urls,
+                session=session,
+                concurrency=self.concurrency,
+                limiter=TokenBucket.from_delay(self.delay_seconds) or host_bucket(BASE_URL),
+                fetch=fetch_content,
+                skip_statuses=(404,),
+            )
         finally:
             session.close()
 
         self._latest_pages = pages
         return pages
 
-    def parse(self, payload: Mapping[str, str]) -> list[TeamDepthChartRecord]:  # type: ignore[override]
+    def parse(self, payload: Mapping[str, bytes]) -> list[TeamDepthChartRecord]:  # type: ignore[override]
         records: list[TeamDepthChartRecord] = []
-        for team, html in payload.items():
-            soup = BeautifulSoup(html, "html.parser")
-            for table in soup.find_all("table"):
-                table_id = table.get("id", "")
-                if not table_id.startswith(DEPTH_CHART_TABLE_PREFIX):
-                    continue
-
-                unit = _unit_from_table_id(table_id)
-                tbody = table.find("tbody")
-                if tbody is None:
-                    continue
-
-                for row in tbody.find_all("tr", recursive=False):
-                    if "class" in row.attrs and "thead" in row["class"]:
-                        continue
-
-                    position_cell = row.find("th", scope="row")
+        for team, content in payload.items():
+            if not content:
+                continue
+            root = parse_html(content)
+            for table in DEPTH_CHART_TABLES_XPATH(root):
+                unit = _unit_from_table_id(table.get("id"))
+                for row in DEPTH_CHART_ROWS_XPATH(table):
+                    position_cell = row.find('.//th[@scope="row"]')
                     if position_cell is None:
                         continue
 
-                    position = position_cell.get_text(strip=True)
-                    slot_cells = row.find_all("td", recursive=False)
+                    position = position_cell.text_content().strip()
+                    slot_cells = row.findall("td")
                     for slot_index, cell in enumerate(slot_cells, start=1):
                         cell_records = _records_from_cell(
                             season=self.season,
@@ -105,25 +111,9 @@ class TeamDepthChartScraper(Scraper):
         processed_dir.mkdir(parents=True, exist_ok=True)
         output_path = processed_dir / f"team_depth_chart_{self.season}.csv"
 
-        records_list = list(records)
+        write_csv(output_path, _FIELDNAMES, records)
 
-        if records_list:
-            import csv
-
-            with output_path.open("w", encoding="utf-8", newline="") as handle:
-                writer = csv.DictWriter(handle, fieldnames=list(asdict(records_list[0]).keys()))
-                writer.writeheader()
-                for item in records_list:
-                    writer.writerow(asdict(item))
-        else:
-            output_path.touch()
-
-        if self._latest_pages:
-            raw_dir = settings.data_paths.raw / "team_depth_charts" / str(self.season)
-            raw_dir.mkdir(parents=True, exist_ok=True)
-            for team, html in self._latest_pages.items():
-                path = raw_dir / f"{team}.html"
-                path.write_text(html, encoding="utf-8")
+        write_raw_pages(settings.data_paths.raw / "team_depth_charts" / str(self.season), self._latest_pages)
 
 
 def _records_from_cell(
@@ -133,18 +123,17 @@ def _records_from_cell(
     unit: str,
     position: str,
     depth_slot: int,
-    cell: Tag,
+    cell: etree._Element,
 ) -> list[TeamDepthChartRecord]:
-    anchors = cell.find_all("a")
-    cell_text = cell.get_text(" ", strip=True)
+    anchors = cell.findall(".//a")
 
     if anchors:
-        note = _derive_note(cell_text, [anchor.get_text(strip=True) for anchor in anchors])
+        note = _derive_note(cell)
         records: list[TeamDepthChartRecord] = []
         for anchor in anchors:
             href = anchor.get("href")
-            player_name = anchor.get_text(strip=True)
-            player_id = _extract_player_id(href) if href else None
+            player_name = anchor.text_content().strip()
+            player_id = extract_player_id(href)
             player_url = _resolve_url(href) if href else None
             records.append(
                 TeamDepthChartRecord(
@@ -161,6 +150,7 @@ def _records_from_cell(
             )
         return records
 
+    cell_text = cell.text_content().strip()
     if cell_text:
         return [
             TeamDepthChartRecord(
@@ -179,11 +169,9 @@ def _records_from_cell(
     return []
 
 
-def _derive_note(cell_text: str, anchor_texts: list[str]) -> str | None:
-    remainder = cell_text
-    for text in anchor_texts:
-        remainder = remainder.replace(text, "", 1).strip()
-    return remainder or None
+def _derive_note(cell: etree._Element) -> str | None:
+    parts = (text.strip() for text in NOTE_TEXT_XPATH(cell))
+    return " ".join(part for part in parts if part) or None
 
 
 def _unit_from_table_id(table_id: str) -> str:
@@ -196,13 +184,6 @@ def _unit_from_table_id(table_id: str) -> str:
     return mapping.get(suffix, suffix.title() if suffix else "Depth Chart")
 
 
-def _extract_player_id(href: str | None) -> str | None:
-    if not href:
-        return None
-    filename = href.rstrip("/").split("/")[-1]
-    return filename.split(".")[0] if filename else None
-
-
 def _resolve_url(href: str | None) -> str | None:
     if not href:
         return None
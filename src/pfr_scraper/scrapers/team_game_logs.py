@@ -2,15 +2,14 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass, asdict
-from typing import Iterable, Mapping, MutableMapping, Sequence
+from typing import Iterable, Mapping, MutableMapping, NamedTuple, Sequence
 
-from bs4 import BeautifulSoup
-from bs4.element import Tag
+from lxml import etree
 
 from pfr_scraper.http import build_session
-from pfr_scraper.http.fetch import fetch_html
-from pfr_scraper.scrapers.base import Scraper
+from pfr_scraper.http.fetch import fetch_content, fetch_many
+from pfr_scraper.http.rate_limit import TokenBucket, host_bucket
+from pfr_scraper.scrapers.base import NOT_THEAD_ROW, Scraper, cell_text, parse_html, write_csv, write_raw_pages
 from pfr_scraper.settings import settings
 
 BASE_URL = "https://www.pro-football-reference.com"
@@ -20,6 +19,13 @@ GAME_TABLES: Mapping[str, str] = {
     "table_pfr_team-year_game-logs_team-year-playoffs-game-log": "playoffs",
 }
 
+# Compiled once; ``$table_id`` is bound per call. Header and partial rows are skipped here.
+GAME_ROWS_XPATH = etree.XPath(
+    f"//table[@id=$table_id]/tbody/tr{NOT_THEAD_ROW}"
+    '[not(contains(concat(" ", normalize-space(@class), " "), " partial_table "))]'
+)
+ROW_CELLS_XPATH = etree.XPath("./*[@data-stat]")
+
 STAT_FIELDS: Mapping[str, str] = {
     "team_game_num_season": "game_number",
     "week_num": "week",
@@ -34,8 +40,7 @@ STAT_FIELDS: Mapping[str, str] = {
 }
 
 
-@dataclass(slots=True)
-class TeamGameLogRecord:
+class TeamGameLogRecord(NamedTuple):
     """Structured summary of a single team game log entry."""
 
     season: int
@@ -54,6 +59,15 @@ class TeamGameLogRecord:
     boxscore_url: str | None
 
 
+_FIELDNAMES = TeamGameLogRecord._fields
+
+# Per-row stat values are collected positionally: data-stat -> index into the
+# record's stat columns (game_number .. overtime), so a row is one list fill.
+_STAT_COLUMNS = _FIELDNAMES[3:-1]
+_STAT_SLOTS: Mapping[str, int] = {stat: _STAT_COLUMNS.index(column) for stat, column in STAT_FIELDS.items()}
+_OPPONENT_SLOT = _STAT_COLUMNS.index("opponent")
+
+
 class TeamGameLogScraper(Scraper):
     """Scrape game logs for teams in a specific season."""
 
@@ -63,47 +77,49 @@ class TeamGameLogScraper(Scraper):
         season: int,
         teams: Sequence[str],
         include_playoffs: bool = True,
+        delay_seconds: float = 0.0,
+        concurrency: int | None = None,
     ) -> None:
         self.season = season
         self.teams: tuple[str, ...] = tuple(teams)
+        self.delay_seconds = max(0.0, delay_seconds)
+        self.concurrency = max(1, concurrency or settings.fetch_concurrency)
         self.include_playoffs = include_playoffs
-        self._latest_pages: MutableMapping[str, str] = {}
+        self._latest_pages: MutableMapping[str, bytes] = {}
 
     @property
     def endpoint(self) -> str:
         return f"{BASE_URL}/teams/"
 
-    def fetch(self) -> Mapping[str, str]:  # type: ignore[override]
+    def fetch(self) -> Mapping[str, bytes]:  # type: ignore[override]
+        urls = {team: f"{self.endpoint}{team}/{self.season}/gamelog/" for team in self.teams}
         session = build_session()
-        pages: dict[str, str] = {}
         try:
-            for team in self.teams:
-                url = f"{self.endpoint}{team}/{self.season}/gamelog/"
-                pages[team] = fetch_html(url, session=session)
+            pages = fetch_many(
+                urls,
+                session=session,
+                concurrency=self.concurrency,
+                limiter=TokenBucket.from_delay(self.delay_seconds) or host_bucket(BASE_URL),
+                fetch=fetch_content,
+                skip_statuses=(404,),
+            )
         finally:
             session.close()
 
         self._latest_pages = pages
         return pages
 
-    def parse(self, payload: Mapping[str, str]) -> list[TeamGameLogRecord]:  # type: ignore[override]
+    def parse(self, payload: Mapping[str, bytes]) -> list[TeamGameLogRecord]:  # type: ignore[override]
         records: list[TeamGameLogRecord] = []
-        table_ids = GAME_TABLES.items()
 
-        for team, html in payload.items():
-            soup = BeautifulSoup(html, "html.parser")
-            for table_id, game_type in table_ids:
+        for team, content in payload.items():
+            if not content:
+                continue
+            root = parse_html(content)
+            for table_id, game_type in GAME_TABLES.items():
                 if not self.include_playoffs and game_type == "playoffs":
                     continue
-                table = soup.find("table", id=table_id)
-                if table is None:
-                    continue
-                tbody = table.find("tbody")
-                if tbody is None:
-                    continue
-                for row in tbody.find_all("tr", recursive=False):
-                    if _is_header_row(row):
-                        continue
+                for row in GAME_ROWS_XPATH(root, table_id=table_id):
                     record = _row_to_record(
                         row=row,
                         season=self.season,
@@ -120,84 +136,37 @@ class TeamGameLogScraper(Scraper):
         processed_dir.mkdir(parents=True, exist_ok=True)
         output_path = processed_dir / f"team_game_logs_{self.season}.csv"
 
-        records_list = list(records)
-
-        if records_list:
-            import csv
+        write_csv(output_path, _FIELDNAMES, records)
 
-            with output_path.open("w", encoding="utf-8", newline="") as handle:
-                writer = csv.DictWriter(handle, fieldnames=list(asdict(records_list[0]).keys()))
-                writer.writeheader()
-                for item in records_list:
-                    writer.writerow(asdict(item))
-        else:
-            output_path.touch()
-
-        if self._latest_pages:
-            raw_dir = settings.data_paths.raw / "team_game_logs" / str(self.season)
-            raw_dir.mkdir(parents=True, exist_ok=True)
-            for team, html in self._latest_pages.items():
-                path = raw_dir / f"{team}.html"
-                path.write_text(html, encoding="utf-8")
+        write_raw_pages(settings.data_paths.raw / "team_game_logs" / str(self.season), self._latest_pages)
 
 
 def _row_to_record(
     *,
-    row: Tag,
+    row: etree._Element,
     season: int,
     team: str,
     game_type: str,
 ) -> TeamGameLogRecord | None:
-    values: dict[str, str | None] = {
-        "season": season,
-        "team": team,
-        "game_type": game_type,
-        "boxscore_url": None,
-    }
-
-    has_opponent = False
+    values: list[str | None] = [None] * len(_STAT_COLUMNS)
+    boxscore_url: str | None = None
+    slot_for = _STAT_SLOTS.get
 
-    for cell in row.find_all(["th", "td"], recursive=False):
+    for cell in ROW_CELLS_XPATH(row):
         stat = cell.get("data-stat")
-        if stat in STAT_FIELDS:
-            key = STAT_FIELDS[stat]
-            values[key] = _cell_text(cell)
-            if key == "opponent" and values[key]:
-                has_opponent = True
+        slot = slot_for(stat)
+        if slot is not None:
+            values[slot] = cell_text(cell)
         if stat == "date":
-            anchor = cell.find("a")
-            if anchor and anchor.get("href"):
-                values["boxscore_url"] = _resolve_url(anchor["href"])
+            anchor = cell.find(".//a")
+            href = anchor.get("href") if anchor is not None else None
+            if href:
+                boxscore_url = _resolve_url(href)
 
-    if not has_opponent:
+    if not values[_OPPONENT_SLOT]:
         return None
 
-    return TeamGameLogRecord(
-        season=values["season"],
-        team=values["team"],
-        game_type=values["game_type"],
-        game_number=values.get("game_number"),
-        week=values.get("week"),
-        date=values.get("date"),
-        day=values.get("day"),
-        home_away=values.get("home_away"),
-        opponent=values.get("opponent"),
-        result=values.get("result"),
-        team_points=values.get("team_points"),
-        opponent_points=values.get("opponent_points"),
-        overtime=values.get("overtime"),
-        boxscore_url=values.get("boxscore_url"),
-    )
-
-
-def _is_header_row(row: Tag) -> bool:
-    classes = row.get("class") or []
-    return "thead" in classes or "partial_table" in classes
-
-
-def _cell_text(cell: Tag) -> str | None:
-    text = cell.get_text(" ", strip=True)
-    return text or None
+    return TeamGameLogRecord(season, team, game_type, *values, boxscore_url)
 
 
 def _resolve_url(href: str) -> str:
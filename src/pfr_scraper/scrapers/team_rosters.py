@@ -2,19 +2,31 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass, asdict
-from typing import Iterable, Mapping, MutableMapping, Sequence
+from typing import Iterable, Iterator, Mapping, MutableMapping, NamedTuple, Sequence
 
-from bs4 import BeautifulSoup
-from bs4.element import Tag
+from lxml import etree
 
 from pfr_scraper.http import build_session
-from pfr_scraper.http.fetch import fetch_html
-from pfr_scraper.scrapers.base import Scraper
+from pfr_scraper.http.fetch import fetch_content, fetch_many, iter_fetch_many
+from pfr_scraper.http.rate_limit import TokenBucket, host_bucket
+from pfr_scraper.scrapers.base import (
+    NOT_THEAD_ROW,
+    Scraper,
+    cell_text,
+    csv_line_formatter,
+    extract_player_id,
+    parse_html,
+    write_columnar,
+    write_csv,
+    write_raw_pages,
+)
 from pfr_scraper.settings import settings
 
 BASE_URL = "https://www.pro-football-reference.com"
 
+ROSTER_ROWS_XPATH = etree.XPath(f'//table[@id="roster"]/tbody/tr{NOT_THEAD_ROW}')
+ROW_CELLS_XPATH = etree.XPath("./*[@data-stat]")
+
 # PFR team abbreviations for current franchises.
 DEFAULT_TEAM_CODES: tuple[str, ...] = (
     "crd",
@@ -52,8 +64,7 @@ DEFAULT_TEAM_CODES: tuple[str, ...] = (
 )
 
 
-@dataclass(slots=True)
-class TeamRosterRecord:
+class TeamRosterRecord(NamedTuple):
     """Structured data representing a team roster entry."""
 
     season: int
@@ -75,6 +86,11 @@ class TeamRosterRecord:
     draft_info: str | None
 
 
+_FIELDNAMES = TeamRosterRecord._fields
+# Only ``season`` is an int; every other field is a string or None.
+_FORMAT_ROW = csv_line_formatter(len(_FIELDNAMES), integer_slots=(0,))
+
+
 class TeamRosterScraper(Scraper):
     """Scrape team rosters for a specific season and export to CSV."""
 
@@ -83,117 +99,136 @@ class TeamRosterScraper(Scraper):
         *,
         season: int,
         teams: Sequence[str] | None = None,
+        delay_seconds: float = 0.0,
+        concurrency: int | None = None,
     ) -> None:
         self.season = season
         self.teams: tuple[str, ...] = tuple(teams or DEFAULT_TEAM_CODES)
-        self._latest_pages: MutableMapping[str, str] = {}
+        self.delay_seconds = max(0.0, delay_seconds)
+        self.concurrency = max(1, concurrency or settings.fetch_concurrency)
+        self._latest_pages: MutableMapping[str, bytes] = {}
 
     @property
     def endpoint(self) -> str:
         return f"{BASE_URL}/teams/"
 
-    def fetch(self) -> Mapping[str, str]:  # type: ignore[override]
+    def fetch(self) -> Mapping[str, bytes]:  # type: ignore[override]
         session = build_session()
-        pages: dict[str, str] = {}
         try:
-            for team in self.teams:
-                url = f"{self.endpoint}{team}/{self.season}_roster.htm"
-                pages[team] = fetch_html(url, session=session)
+            pages = fetch_many(
+                self._urls(),
+                session=session,
+                concurrency=self.concurrency,
+                limiter=TokenBucket.from_delay(self.delay_seconds) or host_bucket(BASE_URL),
+                fetch=fetch_content,
+            )
         finally:
             session.close()
 
-        self._latest_pages = pages
+        self._latest_pages = pages if settings.keep_raw else {}
         return pages
 
-    def parse(self, payload: Mapping[str, str]) -> list[TeamRosterRecord]:  # type: ignore[override]
+    def iter_fetch(self) -> Iterator[tuple[str, bytes]]:  # type: ignore[override]
+        """Yield ``(team, html)`` pairs as each roster page finishes downloading."""
+
+        self._latest_pages = {}
+        session = build_session()
+        try:
+            yield from iter_fetch_many(
+                self._urls(),
+                session=session,
+                concurrency=self.concurrency,
+                limiter=TokenBucket.from_delay(self.delay_seconds) or host_bucket(BASE_URL),
+                fetch=fetch_content,
+            )
+        finally:
+            session.close()
+
+    def parse(self, payload: Mapping[str, bytes]) -> list[TeamRosterRecord]:  # type: ignore[override]
+        records: list[TeamRosterRecord] = []
+        for team, content in payload.items():
+            records.extend(self._parse_team(team, content))
+        return records
+
+    def parse_stream(self, pages: Iterable[tuple[str, bytes]]) -> list[TeamRosterRecord]:  # type: ignore[override]
+        """Parse each page as it arrives so only pages kept for snapshots stay in memory."""
+
+        per_team: dict[str, list[TeamRosterRecord]] = {}
+        for team, content in pages:
+            if settings.keep_raw:
+                self._latest_pages[team] = content
+            per_team[team] = self._parse_team(team, content)
+
+        # Pages complete out of order; emit records in the requested team order.
+        return [record for team in self.teams for record in per_team.get(team, ())]
+
+    def _urls(self) -> dict[str, str]:
+        return {team: f"{self.endpoint}{team}/{self.season}_roster.htm" for team in self.teams}
+
+    def _parse_team(self, team: str, content: bytes) -> list[TeamRosterRecord]:
         records: list[TeamRosterRecord] = []
-        for team, html in payload.items():
-            soup = BeautifulSoup(html, "html.parser")
-            table = soup.find("table", id="roster")
-            if table is None:
+        if not content:
+            return records
+
+        root = parse_html(content)
+        for row in ROSTER_ROWS_XPATH(root):
+            # One pass over the row instead of a lookup scan per column.
+            cells = {cell.get("data-stat"): cell for cell in ROW_CELLS_XPATH(row)}
+            cell_for = cells.get
+
+            player_cell = cell_for("player")
+            if player_cell is None:
                 continue
 
-            tbody = table.find("tbody")
-            if tbody is None:
+            anchor = player_cell.find(".//a")
+            href = anchor.get("href") if anchor is not None else None
+            if not href:
                 continue
 
-            for row in tbody.find_all("tr", recursive=False):
-                if "class" in row.attrs and "thead" in row["class"]:
-                    continue
-
-                player_cell = row.find("td", attrs={"data-stat": "player"})
-                if player_cell is None:
-                    continue
-
-                anchor = player_cell.find("a")
-                if anchor is None or not anchor.get("href"):
-                    continue
-
-                player_name = anchor.get_text(strip=True)
-                player_url = _resolve_url(anchor["href"])
-                player_id = player_cell.get("data-append-csv") or _extract_player_id(anchor["href"])
-
-                record = TeamRosterRecord(
-                    season=self.season,
-                    team=team,
-                    uniform_number=_cell_text(row.find("th", attrs={"data-stat": "uniform_number"})),
-                    player_id=player_id,
-                    player_name=player_name,
-                    player_url=player_url,
-                    position=_cell_text(row.find("td", attrs={"data-stat": "pos"})),
-                    age=_cell_text(row.find("td", attrs={"data-stat": "age"})),
-                    height=_cell_text(row.find("td", attrs={"data-stat": "height"})),
-                    weight=_cell_text(row.find("td", attrs={"data-stat": "weight"})),
-                    experience=_cell_text(row.find("td", attrs={"data-stat": "experience"})),
-                    games_played=_cell_text(row.find("td", attrs={"data-stat": "g"})),
-                    games_started=_cell_text(row.find("td", attrs={"data-stat": "gs"})),
-                    approximate_value=_cell_text(row.find("td", attrs={"data-stat": "av"})),
-                    college=_cell_text(row.find("td", attrs={"data-stat": "college_id"})),
-                    birth_date=_cell_text(row.find("td", attrs={"data-stat": "birth_date_mod"})),
-                    draft_info=_cell_text(row.find("td", attrs={"data-stat": "draft_info"})),
-                )
-                records.append(record)
+            player_name = anchor.text_content().strip()
+            player_url = _resolve_url(href)
+            player_id = player_cell.get("data-append-csv") or extract_player_id(href) or ""
+
+            record = TeamRosterRecord(
+                season=self.season,
+                team=team,
+                uniform_number=cell_text(cell_for("uniform_number")),
+                player_id=player_id,
+                player_name=player_name,
+                player_url=player_url,
+                position=cell_text(cell_for("pos")),
+                age=cell_text(cell_for("age")),
+                height=cell_text(cell_for("height")),
+                weight=cell_text(cell_for("weight")),
+                experience=cell_text(cell_for("experience")),
+                games_played=cell_text(cell_for("g")),
+                games_started=cell_text(cell_for("gs")),
+                approximate_value=cell_text(cell_for("av")),
+                college=cell_text(cell_for("college_id")),
+                birth_date=cell_text(cell_for("birth_date_mod")),
+                draft_info=cell_text(cell_for("draft_info")),
+            )
+            records.append(record)
 
         return records
 
     def persist(self, records: Iterable[TeamRosterRecord]) -> None:  # type: ignore[override]
         processed_dir = settings.data_paths.processed
         processed_dir.mkdir(parents=True, exist_ok=True)
-        output_path = processed_dir / f"team_rosters_{self.season}.csv"
+        output_format = settings.output_format
+        output_path = processed_dir / f"team_rosters_{self.season}.{output_format}"
 
         records_list = list(records)
 
-        if records_list:
-            import csv
-
-            with output_path.open("w", encoding="utf-8", newline="") as handle:
-                writer = csv.DictWriter(handle, fieldnames=list(asdict(records_list[0]).keys()))
-                writer.writeheader()
-                for item in records_list:
-                    writer.writerow(asdict(item))
+        if output_format != "csv":
+            # Records are tuples, so transposing them into columns happens in C.
+            columns = dict(zip(_FIELDNAMES, zip(*records_list))) if records_list else dict.fromkeys(_FIELDNAMES, ())
+            write_columnar(output_path, columns, output_format=output_format, integer_columns=("season",))
         else:
-            # Ensure an empty file with headers exists for consistency.
-            output_path.touch()
+            write_csv(output_path, _FIELDNAMES, records_list, format_row=_FORMAT_ROW if settings.fast_csv else None)
 
         # Persist raw HTML snapshots when available.
-        if self._latest_pages:
-            raw_dir = settings.data_paths.raw / "team_rosters" / str(self.season)
-            raw_dir.mkdir(parents=True, exist_ok=True)
-            for team, html in self._latest_pages.items():
-                path = raw_dir / f"{team}.html"
-                path.write_text(html, encoding="utf-8")
-
-
-def _cell_text(cell: Tag | None) -> str | None:
-    if cell is None:
-        return None
-    text = cell.get_text(" ", strip=True)
-    return text or None
-
-
-def _extract_player_id(href: str) -> str:
-    filename = href.rstrip("/").split("/")[-1]
-    return filename.split(".")[0]
+        write_raw_pages(settings.data_paths.raw / "team_rosters" / str(self.season), self._latest_pages)
 
 
 def _resolve_url(href: str) -> str:
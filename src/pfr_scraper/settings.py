@@ -1,19 +1,29 @@
 """Project-wide configuration helpers."""
 
 from dataclasses import dataclass, field
+from functools import cached_property
 from pathlib import Path
+from typing import Literal
 import os
 
 
-def _env_mapping(prefix: str) -> dict[str, str]:
-    mapping: dict[str, str] = {}
-    offset = len(prefix)
+def _env_mappings(*prefixes: str) -> tuple[dict[str, str], ...]:
+    """Collect ``<prefix><NAME>`` variables for every prefix in one environment scan."""
+
+    mappings: tuple[dict[str, str], ...] = tuple({} for _ in prefixes)
     for key, value in os.environ.items():
-        if key.startswith(prefix):
-            normalized = key[offset:]
-            normalized = normalized.replace("__", "-")
-            mapping[normalized] = value
-    return mapping
+        # Tuple startswith rejects unrelated variables in a single C call.
+        if not key.startswith(prefixes):
+            continue
+        for prefix, mapping in zip(prefixes, mappings):
+            if key.startswith(prefix):
+                mapping[key[len(prefix):].replace("__", "-")] = value
+                break
+    return mappings
+
+
+def _env_flag(name: str) -> bool:
+    return os.environ.get(name, "").strip().lower() in {"1", "true", "yes", "on"}
 
 
 @dataclass(slots=True)
@@ -37,29 +47,50 @@ class HttpSettings:
 
     base_headers: dict[str, str] = field(default_factory=dict)
     cookies: dict[str, str] = field(default_factory=dict)
+    clearance_user_agent: str | None = None
     playwright_profile_dir: Path | None = None
+    cache_enabled: bool = False
+    http2: bool = False
 
     @classmethod
     def from_env(cls) -> "HttpSettings":
-        headers = _env_mapping("PFR_HTTP_HEADER_")
-        cookies = _env_mapping("PFR_HTTP_COOKIE_")
+        headers, cookies = _env_mappings("PFR_HTTP_HEADER_", "PFR_HTTP_COOKIE_")
         profile_env = os.environ.get("PFR_PLAYWRIGHT_PROFILE_DIR")
         profile_dir = Path(profile_env).expanduser() if profile_env else None
         return cls(
             base_headers=headers,
             cookies=cookies,
             playwright_profile_dir=profile_dir,
+            cache_enabled=_env_flag("PFR_HTTP_CACHE"),
+            http2=_env_flag("PFR_HTTP2"),
         )
 
 
-@dataclass(slots=True)
+@dataclass
 class Settings:
-    """Runtime settings for scraper jobs."""
+    """Runtime settings for scraper jobs.
+
+    ``http`` is read from the environment on first access rather than at import.
+    ``Settings`` is not slotted because ``cached_property`` stores into ``__dict__``.
+    """
 
     user_agent_seed: str = "pfr-scraper"
     request_timeout: float = 10.0
+    fetch_concurrency: int = 4
+    # PFR allows about 20 requests a minute and blocks clients that exceed it
+    # instead of answering 429, so the adaptive limiter starts at that pace and
+    # may only creep up to ``max_request_rate``.
+    request_rate: float = 1 / 3
+    max_request_rate: float = 0.5
+    output_format: Literal["csv", "parquet", "feather"] = "csv"
+    raw_compression: Literal["gzip"] | None = None
+    keep_raw: bool = True
+    fast_csv: bool = True
     data_paths: DataPaths = field(default_factory=DataPaths)
-    http: "HttpSettings" = field(default_factory=lambda: HttpSettings.from_env())
+
+    @cached_property
+    def http(self) -> HttpSettings:
+        return HttpSettings.from_env()
 
 
 settings = Settings()
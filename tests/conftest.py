@@ -5,6 +5,8 @@ from __future__ import annotations
 import sys
 from pathlib import Path
 
+import pytest
+
 
 def _ensure_src_on_path() -> None:
     root = Path(__file__).resolve().parents[1]
@@ -20,3 +22,14 @@ def _ensure_src_on_path() -> None:
 
 
 _ensure_src_on_path()
+
+
+@pytest.fixture(autouse=True)
+def _unthrottled_host_buckets(monkeypatch: pytest.MonkeyPatch) -> None:
+    # Scrapers pace real runs at PFR's ~20 requests/minute; stubbed sessions need not wait.
+    from pfr_scraper.http import rate_limit
+    from pfr_scraper.settings import settings
+
+    monkeypatch.setattr(rate_limit, "_HOST_BUCKETS", {})
+    monkeypatch.setattr(settings, "request_rate", 1000.0)
+    monkeypatch.setattr(settings, "max_request_rate", 1000.0)
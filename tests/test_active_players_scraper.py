@@ -17,6 +17,8 @@ SAMPLE_HTML = dedent(
         <p><b><a href="/players/A/TestPl00.htm">Test Player</a> (QB)</b> 2023-2025</p>
         <p><a href="/players/A/OtherPl00.htm">Other Player</a> (RB) 2019-2020</p>
         <p><b><a href="/players/A/ProxyPl01.htm">Proxy Player</a></b> 2022-2024</p>
+        <p><b><a href="">Unlinked Player</a> (K)</b> 2021-2024</p>
+        <p><b><a href=" ">Blank Link Player</a> (P)</b> 2020-2024</p>
     </div>
     """
 )
@@ -25,6 +27,7 @@ SAMPLE_HTML = dedent(
 class StubResponse:
     def __init__(self, payload: str, status_code: int = 200) -> None:
         self.text = payload
+        self.content = payload.encode("utf-8")
         self.status_code = status_code
 
     def raise_for_status(self) -> None:
@@ -113,3 +116,34 @@ def test_active_players_scraper_run(tmp_path, monkeypatch) -> None:
             "position": "",
         },
     }
+
+
+def test_active_players_parse_merges_letters_in_order() -> None:
+    payload = {
+        "B": b'<div id="div_players"><b><a href="/players/B/BetaPl00.htm">Beta Player</a> (WR)</b></div>',
+        "A": SAMPLE_HTML.encode("utf-8"),
+    }
+
+    records = ActivePlayersScraper(letters=("A", "B")).parse(payload)
+
+    assert [record.player_id for record in records] == ["ProxyPl01", "TestPl00", "BetaPl00"]
+    assert records[-1].position == "WR"
+
+
+def test_active_players_run_streams_multiple_letters(tmp_path, monkeypatch) -> None:
+    stub_session = StubSession()
+    monkeypatch.setattr("pfr_scraper.scrapers.active_players.build_session", lambda: stub_session)
+    monkeypatch.setattr(settings.data_paths, "root", tmp_path)
+
+    # run() takes the streaming path, so parse workers start while fetch threads run.
+    records = ActivePlayersScraper(letters=("A", "B", "C"), concurrency=3).run()
+
+    assert sorted(stub_session.calls) == [
+        "https://www.pro-football-reference.com/players/A/",
+        "https://www.pro-football-reference.com/players/B/",
+        "https://www.pro-football-reference.com/players/C/",
+    ]
+    assert stub_session.closed is True
+    # Every letter serves the same page, so players deduplicate to one letter's worth.
+    assert {record.player_id for record in records} == {"TestPl00", "ProxyPl01"}
+    assert (tmp_path / "processed" / "active_players.csv").exists()
@@ -0,0 +1,30 @@
+"""Tests for the shared filesystem helpers."""
+
+from __future__ import annotations
+
+import threading
+
+from pfr_scraper.fileio import write_atomic
+
+
+def test_write_atomic_concurrent_writers_do_not_collide(tmp_path) -> None:
+    target = tmp_path / "cookies.json"
+    payloads = [bytes([65 + index]) * 4096 for index in range(8)]
+    errors: list[BaseException] = []
+
+    def _write(payload: bytes) -> None:
+        try:
+            for _ in range(25):
+                write_atomic(target, payload)
+        except BaseException as exc:  # pragma: no cover - surfaced by the assertion
+            errors.append(exc)
+
+    threads = [threading.Thread(target=_write, args=(payload,)) for payload in payloads]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert errors == []
+    assert target.read_bytes() in payloads
+    assert [path.name for path in tmp_path.iterdir()] == ["cookies.json"]
@@ -0,0 +1,77 @@
+"""Tests for loading harvested Cloudflare cookies."""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from pfr_scraper.http.cookies import load_cookies_from_file
+from pfr_scraper.settings import settings
+
+
+@pytest.fixture
+def http_cookies() -> Any:
+    original = dict(settings.http.cookies)
+    settings.http.cookies = {}
+    try:
+        yield settings.http.cookies
+    finally:
+        settings.http.cookies = original
+
+
+def test_load_cookies_from_list(tmp_path: Path, http_cookies: dict[str, str]) -> None:
+    path = tmp_path / "cf_cookies.json"
+    path.write_text(
+        json.dumps(
+            [
+                {"name": "cf_clearance", "value": "token", "domain": ".pro-football-reference.com"},
+                {"name": "missing_value"},
+            ]
+        ),
+        encoding="utf-8",
+    )
+
+    assert load_cookies_from_file(path) is True
+    assert http_cookies == {"cf_clearance": "token"}
+
+
+def test_load_cookies_from_wrapped_payload(tmp_path: Path, http_cookies: dict[str, str]) -> None:
+    path = tmp_path / "cf_cookies.json"
+    path.write_text(json.dumps({"cookies": [{"name": "__cf_bm", "value": "abc"}]}), encoding="utf-8")
+
+    assert load_cookies_from_file(path) is True
+    assert http_cookies == {"__cf_bm": "abc"}
+
+
+def test_load_cookies_missing_file(tmp_path: Path, http_cookies: dict[str, str]) -> None:
+    assert load_cookies_from_file(tmp_path / "absent.json") is False
+    assert http_cookies == {}
+
+
+def test_load_cookies_reparses_after_file_changes(tmp_path: Path, http_cookies: dict[str, str]) -> None:
+    path = tmp_path / "cf_cookies.json"
+    path.write_text(json.dumps([{"name": "cf_clearance", "value": "old"}]), encoding="utf-8")
+    assert load_cookies_from_file(path) is True
+    assert http_cookies["cf_clearance"] == "old"
+
+    path.write_text(json.dumps([{"name": "cf_clearance", "value": "newer"}]), encoding="utf-8")
+    assert load_cookies_from_file(path) is True
+    assert http_cookies["cf_clearance"] == "newer"
+
+
+def test_load_cookies_records_clearance_user_agent(tmp_path: Path, http_cookies: dict[str, str]) -> None:
+    original_agent = settings.http.clearance_user_agent
+    path = tmp_path / "cf_cookies.json"
+    path.write_text(
+        json.dumps({"user_agent": "Harvest-UA/1.0", "cookies": [{"name": "cf_clearance", "value": "token"}]}),
+        encoding="utf-8",
+    )
+
+    try:
+        assert load_cookies_from_file(path) is True
+        assert settings.http.clearance_user_agent == "Harvest-UA/1.0"
+    finally:
+        settings.http.clearance_user_agent = original_agent
@@ -0,0 +1,248 @@
+"""Tests for the shared fetch helpers and request rate limiting."""
+
+from __future__ import annotations
+
+import pickle
+import threading
+import time
+from typing import Any
+
+import pytest
+import requests
+
+from pfr_scraper.http.cache import HttpCache
+from pfr_scraper.http.fetch import (
+    HtmlBytes,
+    RETRY_AFTER_MAX_SECONDS,
+    fetch_content,
+    fetch_html,
+    fetch_many,
+    iter_fetch_many,
+)
+from pfr_scraper.http.rate_limit import AdaptiveTokenBucket, TokenBucket, host_bucket
+from pfr_scraper.settings import Settings, settings
+
+
+class StubResponse:
+    def __init__(self, payload: str) -> None:
+        self.text = payload
+        self.content = payload.encode("utf-8")
+
+    def raise_for_status(self) -> None:
+        return None
+
+
+class ThrottledResponse(StubResponse):
+    def __init__(self, payload: str, status_code: int, headers: dict[str, str]) -> None:
+        super().__init__(payload)
+        self.status_code = status_code
+        self.headers = headers
+
+    def raise_for_status(self) -> None:
+        if self.status_code >= 400:
+            raise requests.HTTPError(f"HTTP {self.status_code}", response=self)  # type: ignore[arg-type]
+
+
+class ThrottlingSession:
+    def __init__(self, throttled: int, status_code: int = 429, retry_after: str = "0") -> None:
+        self.throttled = throttled
+        self.status_code = status_code
+        self.retry_after = retry_after
+        self.calls = 0
+
+    def get(self, url: str, **_: Any) -> ThrottledResponse:
+        self.calls += 1
+        if self.calls <= self.throttled:
+            return ThrottledResponse("", self.status_code, {"Retry-After": self.retry_after})
+        return ThrottledResponse("<p>ok</p>", 200, {})
+
+
+class RevalidatingSession:
+    def __init__(self) -> None:
+        self.requests: list[dict[str, str]] = []
+
+    def get(self, url: str, headers: dict[str, str] | None = None, **_: Any) -> ThrottledResponse:
+        self.requests.append(dict(headers or {}))
+        if headers and headers.get("If-None-Match") == '"v1"':
+            return ThrottledResponse("", 304, {})
+        response = ThrottledResponse("<p>cached</p>", 200, {"ETag": '"v1"', "Content-Type": "text/html; charset=UTF-8"})
+        response.encoding = "utf-8"
+        return response
+
+
+class MissingPageSession:
+    def get(self, url: str, **_: Any) -> requests.Response:
+        response = requests.Response()
+        response.url = url
+        response.status_code = 404 if "missing" in url else 200
+        response._content = b"<p>ok</p>"
+        return response
+
+
+class SlowSession:
+    def __init__(self, delay: float = 0.05) -> None:
+        self.delay = delay
+        self.active = 0
+        self.peak = 0
+        self._lock = threading.Lock()
+
+    def get(self, url: str, **_: Any) -> StubResponse:
+        with self._lock:
+            self.active += 1
+            self.peak = max(self.peak, self.active)
+        time.sleep(self.delay)
+        with self._lock:
+            self.active -= 1
+        return StubResponse(f"<p>{url}</p>")
+
+
+def test_fetch_many_runs_concurrently_and_preserves_keys() -> None:
+    session = SlowSession()
+    urls = {letter: f"https://example.com/{letter}/" for letter in "ABCD"}
+
+    pages = fetch_many(urls, session=session, concurrency=4)
+
+    assert list(pages) == list("ABCD")
+    assert pages["C"] == "<p>https://example.com/C/</p>"
+    assert session.peak > 1
+
+
+def test_iter_fetch_many_yields_pages_as_they_complete() -> None:
+    class StaggeredSession:
+        def get(self, url: str, **_: Any) -> StubResponse:
+            if url.endswith("/A/"):
+                time.sleep(0.2)
+            return StubResponse(url)
+
+    urls = {"A": "https://example.com/A/", "B": "https://example.com/B/"}
+
+    keys = [key for key, _ in iter_fetch_many(urls, session=StaggeredSession(), concurrency=2)]
+
+    assert keys == ["B", "A"]
+
+
+def test_fetch_many_can_return_raw_bytes() -> None:
+    session = SlowSession(delay=0)
+    urls = {"A": "https://example.com/A/"}
+
+    pages = fetch_many(urls, session=session, fetch=fetch_content)
+
+    assert pages == {"A": b"<p>https://example.com/A/</p>"}
+
+
+def test_fetch_many_skips_requested_statuses() -> None:
+    urls = {"sfo": "https://example.com/sfo/", "old": "https://example.com/missing/"}
+
+    pages = fetch_many(urls, session=MissingPageSession(), skip_statuses=(404,))
+
+    assert pages == {"sfo": "<p>ok</p>"}
+
+
+def test_token_bucket_spaces_requests() -> None:
+    bucket = TokenBucket(rate=20.0)
+
+    started = time.monotonic()
+    for _ in range(3):
+        bucket.acquire()
+    elapsed = time.monotonic() - started
+
+    # First token is immediate, the next two wait ~50ms each.
+    assert elapsed >= 0.09
+
+
+def test_token_bucket_from_delay_disables_limit_for_zero() -> None:
+    assert TokenBucket.from_delay(0) is None
+    assert TokenBucket.from_delay(2.0).rate == 0.5
+
+
+def test_adaptive_bucket_increases_additively_and_decreases_multiplicatively() -> None:
+    bucket = AdaptiveTokenBucket(2.0, increase=0.5, decrease=0.5, max_rate=3.0)
+
+    bucket.on_success()
+    assert bucket.rate == 2.5
+    bucket.on_success()
+    bucket.on_success()
+    assert bucket.rate == 3.0
+
+    bucket.on_failure()
+    assert bucket.rate == 1.5
+
+
+def test_fetch_html_retries_429_and_reports_to_limiter(monkeypatch) -> None:
+    monkeypatch.setattr("pfr_scraper.http.fetch._backoff", lambda attempt, retry_after: 0.0)
+    session = ThrottlingSession(throttled=2)
+    bucket = AdaptiveTokenBucket(100.0, increase=1.0, decrease=0.5)
+
+    html = fetch_html("https://example.com/", session=session, limiter=bucket)
+
+    assert html == "<p>ok</p>"
+    assert session.calls == 3
+    # Halved twice by the 429s, then one additive step for the success.
+    assert bucket.rate == 26.0
+
+
+def test_fetch_html_fails_fast_on_excessive_retry_after(monkeypatch) -> None:
+    sleeps: list[float] = []
+    monkeypatch.setattr("pfr_scraper.http.fetch.time.sleep", sleeps.append)
+    session = ThrottlingSession(throttled=1, retry_after="86400")
+    bucket = AdaptiveTokenBucket(100.0)
+
+    with pytest.raises(requests.HTTPError):
+        fetch_html("https://example.com/", session=session, limiter=bucket)
+
+    assert session.calls == 1
+    assert sleeps == []
+    # The limiter pauses, but no longer than the cap.
+    assert bucket._resume_at - time.monotonic() <= RETRY_AFTER_MAX_SECONDS
+
+
+def test_fetch_html_retries_transient_server_errors(monkeypatch) -> None:
+    monkeypatch.setattr("pfr_scraper.http.fetch._backoff", lambda attempt, retry_after: 0.0)
+    session = ThrottlingSession(throttled=5, status_code=503)
+
+    assert fetch_html("https://example.com/", session=session) == "<p>ok</p>"
+    assert session.calls == 6
+
+
+def test_fetch_html_revalidates_stale_cache_entries(tmp_path, monkeypatch) -> None:
+    monkeypatch.setattr(settings.data_paths, "root", tmp_path)
+    monkeypatch.setattr(settings.http, "cache_enabled", True)
+    session = RevalidatingSession()
+    url = "https://example.com/cached/"
+
+    assert fetch_html(url, session=session) == "<p>cached</p>"
+    # Fresh entries are served without a request.
+    assert fetch_html(url, session=session) == "<p>cached</p>"
+    assert len(session.requests) == 1
+
+    stale_cache = HttpCache(tmp_path / "raw" / "cache", max_age=0)
+    monkeypatch.setattr("pfr_scraper.http.fetch.http_cache", lambda: stale_cache)
+    content = fetch_content(url, session=session)
+    assert content == b"<p>cached</p>"
+    # The declared charset survives the cache so the parser can still use it.
+    assert content.encoding == "utf-8"
+    assert session.requests[-1] == {"If-None-Match": '"v1"'}
+
+
+def test_host_bucket_defaults_to_pfr_request_budget(monkeypatch) -> None:
+    defaults = Settings()
+    monkeypatch.setattr(settings, "request_rate", defaults.request_rate)
+    monkeypatch.setattr(settings, "max_request_rate", defaults.max_request_rate)
+
+    bucket = host_bucket("https://www.pro-football-reference.com/players/A/")
+    assert bucket.rate * 60 == pytest.approx(20)
+
+    for _ in range(100):
+        bucket.on_success()
+
+    assert bucket.rate == defaults.max_request_rate
+    assert host_bucket("https://www.pro-football-reference.com/teams/") is bucket
+
+
+def test_html_bytes_keeps_charset_across_pickling() -> None:
+    page = HtmlBytes("José".encode("utf-8"), "utf-8")
+
+    restored = pickle.loads(pickle.dumps(page))
+
+    assert restored == page
+    assert restored.encoding == "utf-8"
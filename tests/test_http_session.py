@@ -2,11 +2,15 @@
 
 from __future__ import annotations
 
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 from types import SimpleNamespace
 from typing import Any
 
 import pytest
 import requests
+from requests.adapters import HTTPAdapter
 
 from pfr_scraper.http import build_session
 from pfr_scraper.settings import settings
@@ -55,18 +59,28 @@ class DummyEmulator:
         )
 
 
+def _ok_response(request: requests.PreparedRequest) -> requests.Response:
+    response = requests.Response()
+    response.status_code = 200
+    response.request = request
+    response.url = request.url
+    return response
+
+
+def _cookie_pairs(header: str) -> dict[str, str]:
+    pairs = (part.strip().split("=", 1) for part in header.split(";") if part.strip())
+    return {name: value for name, value in pairs}
+
+
 def test_build_session_merges_headers_and_records_success(monkeypatch: Any) -> None:
     captured: dict[str, Any] = {}
 
-    def fake_request(self: requests.Session, method: str, url: str, **kwargs: Any) -> Any:
+    def fake_send(self: HTTPAdapter, request: requests.PreparedRequest, **kwargs: Any) -> Any:
         captured.update(kwargs)
+        captured["request"] = request
+        return _ok_response(request)
 
-        class Response:
-            status_code = 200
-
-        return Response()
-
-    monkeypatch.setattr(requests.Session, "request", fake_request, raising=False)
+    monkeypatch.setattr(HTTPAdapter, "send", fake_send)
 
     original_headers = dict(settings.http.base_headers)
     original_cookies = dict(settings.http.cookies)
@@ -78,15 +92,16 @@ def test_build_session_merges_headers_and_records_success(monkeypatch: Any) -> N
 
     session.get("https://example.com", headers={"X-Extra": "1"})
 
-    headers = captured["headers"]
+    headers = captured["request"].headers
     assert headers["X-Base"] == "base"
     assert headers["X-Extra"] == "1"
     assert headers["X-Generated"] == "value"
     assert headers["User-Agent"] == "dummy-UA"
     assert headers["X-Env"] == "env"
 
-    cookies = captured["cookies"]
+    cookies = _cookie_pairs(headers["Cookie"])
     assert cookies["session"] == "abc"
+    assert cookies["cf_clearance"] == "token"
     assert session.cookies.get("cf_clearance") == "token"
 
     assert captured["timeout"] == settings.request_timeout
@@ -98,10 +113,10 @@ def test_build_session_merges_headers_and_records_success(monkeypatch: Any) -> N
 
 
 def test_build_session_records_failure_on_exception(monkeypatch: Any) -> None:
-    def fake_request(self: requests.Session, method: str, url: str, **kwargs: Any) -> Any:
+    def fake_send(self: HTTPAdapter, request: requests.PreparedRequest, **kwargs: Any) -> Any:
         raise requests.exceptions.Timeout()
 
-    monkeypatch.setattr(requests.Session, "request", fake_request, raising=False)
+    monkeypatch.setattr(HTTPAdapter, "send", fake_send)
 
     emulator = DummyEmulator()
     session = build_session(emulator=emulator)
@@ -116,15 +131,12 @@ def test_build_session_records_failure_on_exception(monkeypatch: Any) -> None:
 def test_build_session_applies_proxy_mapping(monkeypatch: Any) -> None:
     captured: dict[str, Any] = {}
 
-    def fake_request(self: requests.Session, method: str, url: str, **kwargs: Any) -> Any:
+    def fake_send(self: HTTPAdapter, request: requests.PreparedRequest, **kwargs: Any) -> Any:
         captured.update(kwargs)
 
-        class Response:
-            status_code = 200
-
-        return Response()
+        return _ok_response(request)
 
-    monkeypatch.setattr(requests.Session, "request", fake_request, raising=False)
+    monkeypatch.setattr(HTTPAdapter, "send", fake_send)
 
     proxy = SimpleNamespace(url="http://proxy.local:8080")
     emulator = DummyEmulator(proxy=proxy)
@@ -137,3 +149,104 @@ def test_build_session_applies_proxy_mapping(monkeypatch: Any) -> None:
         "https": proxy.url,
     }
     assert emulator.builder.proxy_manager.events == [("success", proxy)]
+
+
+def test_build_session_pins_clearance_user_agent(monkeypatch: Any) -> None:
+    captured: dict[str, Any] = {}
+
+    def fake_send(self: HTTPAdapter, request: requests.PreparedRequest, **kwargs: Any) -> Any:
+        captured["request"] = request
+        return _ok_response(request)
+
+    monkeypatch.setattr(HTTPAdapter, "send", fake_send)
+    monkeypatch.setattr(settings.http, "cookies", {"cf_clearance": "token"})
+    monkeypatch.setattr(settings.http, "clearance_user_agent", "Harvest-UA/1.0")
+
+    session = build_session(emulator=DummyEmulator())
+    session.get("https://example.com")
+
+    headers = captured["request"].headers
+    assert headers["User-Agent"] == "Harvest-UA/1.0"
+    assert headers["X-Generated"] == "value"
+
+
+def test_build_session_tunes_connection_pool(monkeypatch) -> None:
+    monkeypatch.setattr(settings, "fetch_concurrency", 24)
+
+    session = build_session(emulator=DummyEmulator())
+    adapter = session.get_adapter("https://www.pro-football-reference.com/")
+
+    assert adapter._pool_maxsize == 24
+
+
+def test_build_session_leaves_throttled_responses_to_caller(monkeypatch) -> None:
+    monkeypatch.setenv("NO_PROXY", "127.0.0.1")
+    hits: list[str] = []
+
+    class ThrottlingHandler(BaseHTTPRequestHandler):
+        def do_GET(self) -> None:
+            hits.append(self.path)
+            self.send_response(429)
+            self.send_header("Retry-After", "1")
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+
+        def log_message(self, *_: Any) -> None:
+            return None
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), ThrottlingHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        session = build_session(emulator=DummyEmulator())
+        started = time.monotonic()
+        response = session.get(f"http://127.0.0.1:{server.server_port}/throttled")
+        elapsed = time.monotonic() - started
+    finally:
+        server.shutdown()
+        server.server_close()
+
+    assert response.status_code == 429
+    assert hits == ["/throttled"]
+    assert elapsed < 1.0
+
+
+def test_build_http2_client_honours_env_proxy_and_fires_hooks(monkeypatch) -> None:
+    pytest.importorskip("httpx")
+    pytest.importorskip("h2")
+    seen: list[tuple[str, str | None]] = []
+
+    class ProxyHandler(BaseHTTPRequestHandler):
+        def do_GET(self) -> None:
+            seen.append((self.path, self.headers.get("X-Generated")))
+            self.send_response(200)
+            self.send_header("Content-Length", "2")
+            self.end_headers()
+            self.wfile.write(b"ok")
+
+        def log_message(self, *_: Any) -> None:
+            return None
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), ProxyHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    for name in ("NO_PROXY", "no_proxy", "ALL_PROXY", "all_proxy"):
+        monkeypatch.delenv(name, raising=False)
+    monkeypatch.setenv("HTTP_PROXY", f"http://127.0.0.1:{server.server_port}")
+    monkeypatch.setattr(settings.http, "http2", True)
+
+    emulator = DummyEmulator()
+    try:
+        client = build_session(emulator=emulator)
+        with client:
+            response = client.get("http://pfr.invalid/players/")
+    finally:
+        server.shutdown()
+        server.server_close()
+
+    assert response.status_code == 200
+    # A forward proxy receives the absolute URI of the target.
+    assert seen == [("http://pfr.invalid/players/", "value")]
+    assert response.request.headers["User-Agent"] == "dummy-UA"
+    assert emulator.rotator.successes == ["profile-1"]
+    assert emulator.rotator.failures == []
@@ -41,6 +41,7 @@ SAMPLE_DEPTH_CHART_HTML = dedent(
 class StubResponse:
     def __init__(self, payload: str) -> None:
         self.text = payload
+        self.content = payload.encode("utf-8")
 
     def raise_for_status(self) -> None:
         return None
@@ -55,6 +55,7 @@ SAMPLE_GAME_LOG_HTML = dedent(
 class StubResponse:
     def __init__(self, payload: str) -> None:
         self.text = payload
+        self.content = payload.encode("utf-8")
 
     def raise_for_status(self) -> None:  # pragma: no cover - simple stub
         return None
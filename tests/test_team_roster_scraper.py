@@ -3,10 +3,14 @@
 from __future__ import annotations
 
 import csv
+import gzip
+import sys
 from textwrap import dedent
 from typing import Any
 
-from pfr_scraper.scrapers.team_rosters import TeamRosterScraper
+import pytest
+
+from pfr_scraper.scrapers.team_rosters import TeamRosterRecord, TeamRosterScraper
 from pfr_scraper.settings import settings
 
 SAMPLE_ROSTER_HTML = dedent(
@@ -52,6 +56,7 @@ SAMPLE_ROSTER_HTML = dedent(
 class StubResponse:
     def __init__(self, payload: str) -> None:
         self.text = payload
+        self.content = payload.encode("utf-8")
 
     def raise_for_status(self) -> None:
         return None
@@ -110,3 +115,160 @@ def test_team_roster_scraper(tmp_path, monkeypatch) -> None:
 
     raw_snapshot = tmp_path / "raw" / "team_rosters" / "2024" / "sfo.html"
     assert raw_snapshot.exists()
+
+
+def test_team_roster_columnar_output_requires_pyarrow(tmp_path, monkeypatch) -> None:
+    monkeypatch.setattr("pfr_scraper.scrapers.team_rosters.build_session", StubSession)
+    # A None entry in sys.modules makes ``import pyarrow`` raise ImportError.
+    monkeypatch.setitem(sys.modules, "pyarrow", None)
+    monkeypatch.setattr(settings, "output_format", "parquet")
+    monkeypatch.setattr(settings.data_paths, "root", tmp_path)
+
+    with pytest.raises(ImportError, match="pyarrow"):
+        TeamRosterScraper(season=2024, teams=("sfo",)).run()
+
+
+@pytest.mark.parametrize("output_format", ["parquet", "feather"])
+def test_team_roster_columnar_output_round_trips(tmp_path, monkeypatch, output_format) -> None:
+    pa = pytest.importorskip("pyarrow")
+    from pyarrow import feather, parquet
+
+    monkeypatch.setattr("pfr_scraper.scrapers.team_rosters.build_session", StubSession)
+    monkeypatch.setattr(settings, "output_format", output_format)
+    monkeypatch.setattr(settings.data_paths, "root", tmp_path)
+
+    records = TeamRosterScraper(season=2024, teams=("sfo",)).run()
+
+    output_path = tmp_path / "processed" / f"team_rosters_2024.{output_format}"
+    reader = parquet.read_table if output_format == "parquet" else feather.read_table
+    table = reader(output_path)
+
+    assert table.column_names == list(TeamRosterRecord._fields)
+    assert table.schema.field("season").type == pa.int64()
+    assert [tuple(row.values()) for row in table.to_pylist()] == [tuple(record) for record in records]
+
+
+def test_team_roster_gzips_raw_snapshots(tmp_path, monkeypatch) -> None:
+    monkeypatch.setattr("pfr_scraper.scrapers.team_rosters.build_session", StubSession)
+    monkeypatch.setattr(settings, "raw_compression", "gzip")
+    monkeypatch.setattr(settings.data_paths, "root", tmp_path)
+
+    TeamRosterScraper(season=2024, teams=("sfo",)).run()
+
+    raw_dir = tmp_path / "raw" / "team_rosters" / "2024"
+    assert not (raw_dir / "sfo.html").exists()
+    assert gzip.decompress((raw_dir / "sfo.html.gz").read_bytes()).decode("utf-8") == SAMPLE_ROSTER_HTML
+
+
+def test_team_roster_persist_writes_header_without_records(tmp_path, monkeypatch) -> None:
+    monkeypatch.setattr(settings.data_paths, "root", tmp_path)
+
+    TeamRosterScraper(season=2024, teams=("sfo",)).persist([])
+
+    processed_path = tmp_path / "processed" / "team_rosters_2024.csv"
+    with processed_path.open("r", encoding="utf-8", newline="") as handle:
+        assert next(csv.reader(handle)) == list(TeamRosterRecord._fields)
+
+
+def test_team_roster_skips_raw_snapshots_when_disabled(tmp_path, monkeypatch) -> None:
+    monkeypatch.setattr("pfr_scraper.scrapers.team_rosters.build_session", StubSession)
+    monkeypatch.setattr(settings, "keep_raw", False)
+    monkeypatch.setattr(settings.data_paths, "root", tmp_path)
+
+    records = TeamRosterScraper(season=2024, teams=("sfo", "nyg"), concurrency=2).run()
+
+    assert [record.team for record in records] == ["sfo", "sfo", "nyg", "nyg"]
+    assert (tmp_path / "processed" / "team_rosters_2024.csv").exists()
+    assert not (tmp_path / "raw" / "team_rosters").exists()
+
+
+def test_team_roster_fast_csv_matches_csv_writer(tmp_path, monkeypatch) -> None:
+    monkeypatch.setattr(settings.data_paths, "root", tmp_path)
+    record = TeamRosterRecord(
+        2024, "sfo", None, "Odd00", 'Jr., "Odd"', "url", "QB", "", "6-2", "210",
+        "Rook\nie", None, "0", "1\r2", "A, B", None, "Team / 1st",
+    )
+    output_path = tmp_path / "processed" / "team_rosters_2024.csv"
+    scraper = TeamRosterScraper(season=2024, teams=("sfo",))
+
+    monkeypatch.setattr(settings, "fast_csv", False)
+    scraper.persist([record, record])
+    expected = output_path.read_bytes()
+
+    monkeypatch.setattr(settings, "fast_csv", True)
+    scraper.persist([record, record])
+    assert output_path.read_bytes() == expected
+
+
+def test_team_roster_run_parses_each_page_once(tmp_path, monkeypatch) -> None:
+    from pfr_scraper.scrapers import team_rosters
+
+    parsed: list[bytes] = []
+    parse_html = team_rosters.parse_html
+
+    def counting_parse_html(content: bytes) -> Any:
+        parsed.append(content)
+        return parse_html(content)
+
+    monkeypatch.setattr(team_rosters, "build_session", StubSession)
+    monkeypatch.setattr(team_rosters, "parse_html", counting_parse_html)
+    monkeypatch.setattr(settings.data_paths, "root", tmp_path)
+
+    TeamRosterScraper(season=2024, teams=("sfo", "nyg"), concurrency=2).run()
+
+    assert len(parsed) == 2
+
+
+def test_team_roster_parse_skips_only_thead_class_rows() -> None:
+    payload = dedent(
+        """
+        <table id="roster"><tbody>
+            <tr class="over_header thead"><td data-stat="player"><a href="/players/H/Head00.htm">Player</a></td></tr>
+            <tr class="theadless"><td data-stat="player"><a href="/players/K/Kept00.htm">Kept Player</a></td></tr>
+        </tbody></table>
+        """
+    ).encode("utf-8")
+
+    records = TeamRosterScraper(season=2024, teams=("sfo",)).parse({"sfo": payload})
+
+    assert [record.player_id for record in records] == ["Kept00"]
+
+
+class CharsetStubSession(StubSession):
+    def get(self, url: str, **_: Any) -> StubResponse:
+        self.calls.append(url)
+        payload = SAMPLE_ROSTER_HTML.replace("Test Player", "José Ñandú")
+        response = StubResponse(payload)
+        response.headers = {"Content-Type": "text/html; charset=utf-8"}
+        return response
+
+
+def test_team_roster_decodes_with_declared_charset(tmp_path, monkeypatch) -> None:
+    # The fixture has no <meta charset>; only the Content-Type header names UTF-8.
+    assert "charset" not in SAMPLE_ROSTER_HTML
+    monkeypatch.setattr("pfr_scraper.scrapers.team_rosters.build_session", CharsetStubSession)
+    monkeypatch.setattr(settings.data_paths, "root", tmp_path)
+
+    records = TeamRosterScraper(season=2024, teams=("sfo",)).run()
+
+    assert records[0].player_name == "José Ñandú"
+
+
+def test_team_roster_delay_overrides_adaptive_pacing(monkeypatch) -> None:
+    from pfr_scraper.http.rate_limit import AdaptiveTokenBucket, TokenBucket
+
+    limiters: list[Any] = []
+
+    def fake_iter_fetch_many(urls: Any, *, limiter: Any, **_: Any) -> Any:
+        limiters.append(limiter)
+        return iter(())
+
+    monkeypatch.setattr("pfr_scraper.scrapers.team_rosters.build_session", StubSession)
+    monkeypatch.setattr("pfr_scraper.scrapers.team_rosters.iter_fetch_many", fake_iter_fetch_many)
+
+    list(TeamRosterScraper(season=2024, teams=("sfo",), delay_seconds=3.0).iter_fetch())
+    list(TeamRosterScraper(season=2024, teams=("sfo",)).iter_fetch())
+
+    fixed, adaptive = limiters
+    assert type(fixed) is TokenBucket and fixed.rate == pytest.approx(1 / 3)
+    assert isinstance(adaptive, AdaptiveTokenBucket)